@@ -7,19 +7,43 @@ A multi-agent AI framework for automated Godot game development.
 __version__ = "0.2.0"
 __author__ = "Christian"
 
-from .orchestrator import (
-    Orchestrator,
-    Session,
-    SessionManager,
-    Pipeline,
-    PipelineResult,
-    TaskType,
-)
-from .agents import (
-    AgentFactory,
-    AgentResponse,
-    BaseAgent,
-)
+from typing import TYPE_CHECKING, Any
+
+from .utils.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .agents import (
+        AgentFactory,
+        AgentResponse,
+        BaseAgent,
+    )
+    from .orchestrator import (
+        Orchestrator,
+        Pipeline,
+        PipelineResult,
+        Session,
+        SessionManager,
+        TaskType,
+    )
+
+# Public names are imported on first access so `import gads.<submodule>`
+# (e.g. the CLI) doesn't pay for loading every agent and orchestrator module.
+_LAZY_IMPORTS = {
+    "Orchestrator": ".orchestrator",
+    "Session": ".orchestrator",
+    "SessionManager": ".orchestrator",
+    "Pipeline": ".orchestrator",
+    "PipelineResult": ".orchestrator",
+    "TaskType": ".orchestrator",
+    "AgentFactory": ".agents",
+    "AgentResponse": ".agents",
+    "BaseAgent": ".agents",
+}
+
+
+def __getattr__(name: str) -> Any:
+    return lazy_getattr(globals(), _LAZY_IMPORTS, name)
+
 
 __all__ = [
     "__version__",
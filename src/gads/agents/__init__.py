@@ -4,13 +4,13 @@ GADS Agents Module
 AI agents for different aspects of game development.
 """
 
-from .base import BaseAgent, AgentConfig, AgentResponse, ModelProvider, TokenUsage
 from .architect import ArchitectAgent
+from .base import MODEL_PRICING, AgentConfig, AgentResponse, BaseAgent, ModelProvider, TokenUsage
 from .designer import DesignerAgent
 from .developer_2d import Developer2DAgent
 from .developer_3d import Developer3DAgent
+from .factory import AGENT_CLASSES, AgentFactory, create_agents_from_config
 from .qa import QAAgent
-from .factory import AgentFactory, create_agents_from_config, AGENT_CLASSES
 
 __all__ = [
     "BaseAgent",
@@ -18,6 +18,7 @@ __all__ = [
     "AgentResponse",
     "ModelProvider",
     "TokenUsage",
+    "MODEL_PRICING",
     "ArchitectAgent",
     "DesignerAgent",
     "Developer2DAgent",
@@ -35,6 +35,21 @@ class AgentConfig(BaseModel):
     base_url: str | None = None  # For Ollama
 
 
+# Pricing in USD per million (input, output) tokens (as of 2024)
+MODEL_PRICING: dict[str, tuple[float, float]] = {
+    # Anthropic
+    "claude-opus-4-5-20250514": (15.0, 75.0),
+    "claude-sonnet-4-5-20250929": (3.0, 15.0),
+    "claude-haiku-4-5-20251001": (0.8, 4.0),
+    # Older Claude models
+    "claude-3-opus-20240229": (15.0, 75.0),
+    "claude-3-5-sonnet-20241022": (3.0, 15.0),
+}
+
+# Unknown Claude models are priced like Opus; other (local Ollama) models are free
+DEFAULT_PRICING = (15.0, 75.0)
+
+
 class TokenUsage(BaseModel):
     """Token usage statistics from an LLM call."""
     
@@ -45,25 +60,18 @@ class TokenUsage(BaseModel):
     def total_tokens(self) -> int:
         return self.input_tokens + self.output_tokens
     
+    @staticmethod
+    def rates_for(model: str) -> tuple[float, float]:
+        """Get the (input, output) cost in USD per token for a model."""
+        if model not in MODEL_PRICING and not model.startswith("claude"):
+            return 0.0, 0.0
+        input_rate, output_rate = MODEL_PRICING.get(model, DEFAULT_PRICING)
+        return input_rate / 1_000_000, output_rate / 1_000_000
+    
     def estimate_cost(self, model: str) -> float:
         """Estimate cost in USD based on model pricing."""
-        # Pricing per million tokens (as of 2024)
-        pricing = {
-            # Anthropic
-            "claude-opus-4-5-20250514": {"input": 15.0, "output": 75.0},
-            "claude-sonnet-4-5-20250929": {"input": 3.0, "output": 15.0},
-            "claude-haiku-4-5-20251001": {"input": 0.8, "output": 4.0},
-            # Older Claude models
-            "claude-3-opus-20240229": {"input": 15.0, "output": 75.0},
-            "claude-3-5-sonnet-20241022": {"input": 3.0, "output": 15.0},
-        }
-        
-        # Default to Opus pricing for unknown models
-        rates = pricing.get(model, {"input": 15.0, "output": 75.0})
-        
-        cost = (self.input_tokens / 1_000_000 * rates["input"] +
-                self.output_tokens / 1_000_000 * rates["output"])
-        return cost
+        input_rate, output_rate = self.rates_for(model)
+        return self.input_tokens * input_rate + self.output_tokens * output_rate
 
 
 class AgentResponse(BaseModel):
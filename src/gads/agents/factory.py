@@ -6,6 +6,7 @@ Creates and manages agent instances from configuration.
 
 from __future__ import annotations
 
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -77,6 +78,8 @@ class AgentFactory:
         
         with open(path) as f:
             self._raw_config = yaml.safe_load(f)
+        # Drop the memoized agent list so it reflects the new config
+        self.__dict__.pop("_available_agent_names", None)
         
         return self._raw_config
     
@@ -152,12 +155,17 @@ class AgentFactory:
         """Get all created agents."""
         return self._agents
     
+    @cached_property
+    def _available_agent_names(self) -> tuple[str, ...]:
+        """Names of agents available in config (memoized until the config is reloaded)."""
+        if not self._raw_config:
+            return ()
+        return tuple(name for name in self._raw_config if name in AGENT_CLASSES)
+    
     @property
     def available_agents(self) -> list[str]:
         """Get list of agent names available in config."""
-        if not self._raw_config:
-            return []
-        return [name for name in self._raw_config if name in AGENT_CLASSES]
+        return list(self._available_agent_names)
 
 
 def create_agents_from_config(
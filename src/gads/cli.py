@@ -6,26 +6,44 @@ Command-line interface for the Godot Agentic Development System.
 
 from __future__ import annotations
 
-import asyncio
+import atexit
+import bisect
+import contextlib
+import functools
+import itertools
+import os
+import re
+import time
+from collections.abc import Callable, Coroutine
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import typer
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
+from rich.markup import escape
 from rich.panel import Panel
-from rich.markdown import Markdown
 from rich.table import Table
-from rich.prompt import Confirm
+from rich.text import Text
 
-from .orchestrator import Orchestrator, TaskType, RoutingDecision, PipelineRegistry, PipelineStatus, PipelineEvent
-from .agents import TokenUsage
-from .utils import load_settings, setup_logging, get_logger
-from .tools import GodotTool, BlenderMCPTool
+from .utils import get_logger
+
+if TYPE_CHECKING:
+    import asyncio
+    
+    from .agents import AgentResponse
+    from .orchestrator import Orchestrator, PipelineRegistry, RoutingDecision, Session
+    from .tools import BlenderMCPTool, GodotTool
+    from .utils import Settings
+
+# Orchestrator, agent, tool and asyncio imports live inside the commands that
+# need them, so `gads --help` and simple subcommands start quickly.
 
 app = typer.Typer(
     name="gads",
     help="Godot Agentic Development System - Multi-agent AI framework for game development",
 )
 console = Console()
+logger = get_logger(__name__)
 
 # Global orchestrator instance (lazy loaded)
 _orchestrator: Orchestrator | None = None
@@ -35,14 +53,129 @@ def get_orchestrator() -> Orchestrator:
     """Get or create the global orchestrator instance."""
     global _orchestrator
     if _orchestrator is None:
-        settings = load_settings()
+        from .orchestrator import Orchestrator
+        from .utils import setup_logging
+        
+        settings = _get_settings()
         setup_logging(settings.log_level, settings.log_file)
         _orchestrator = Orchestrator(settings=settings)
     return _orchestrator
 
 
+@functools.lru_cache(maxsize=1)
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the event loop shared by all commands in this process (uvloop if installed)."""
+    import asyncio
+    
+    try:
+        import uvloop
+        loop = uvloop.new_event_loop()
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    atexit.register(_close_loop, loop)
+    return loop
+
+
+def _close_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Close the orchestrator's connections, finalize async work, then close the loop."""
+    try:
+        if _orchestrator is not None:
+            loop.run_until_complete(_orchestrator.aclose())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        loop.close()
+
+
+def _run(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion on the shared event loop."""
+    return _get_loop().run_until_complete(coro)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_settings() -> Settings:
+    """Load settings once per process (.env is only parsed on first use)."""
+    from .utils import load_settings
+    return load_settings()
+
+
+@functools.lru_cache(maxsize=1)
+def _blender_tool_cls() -> type[BlenderMCPTool]:
+    """Import BlenderMCPTool on first use so other commands don't pay for it."""
+    from .tools.blender_mcp import BlenderMCPTool
+    return BlenderMCPTool
+
+
+@functools.lru_cache(maxsize=1)
+def _templates_dir() -> Path:
+    """Get the pipeline templates directory (resolved once per process)."""
+    return Path.cwd() / "templates"
+
+
+@functools.lru_cache(maxsize=1)
+def _pipeline_registry() -> PipelineRegistry:
+    """Get the pipeline registry, reusing parsed templates from the on-disk cache."""
+    from .orchestrator import PipelineRegistry
+    return PipelineRegistry.load_cached(
+        _templates_dir(),
+        cache_file=_get_settings().cache_dir / "pipeline_registry.json",
+    )
+
+
+def _status(message: str) -> contextlib.AbstractContextManager[Any]:
+    """Spinner while work runs; a no-op when output isn't a terminal."""
+    if console.is_terminal:
+        return console.status(message, spinner="dots")
+    return contextlib.nullcontext()
+
+
+def _buffered_output(func: Callable[..., None]) -> Callable[..., None]:
+    """
+    Buffer a command's console output and write it in one go when it returns.
+    
+    Only for commands without spinners, progress bars or prompts, which need
+    to reach the terminal immediately.
+    """
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> None:
+        with console:
+            func(*args, **kwargs)
+    return wrapper
+
+
+def _resolve_session(
+    orchestrator: Orchestrator,
+    session_id: str | None,
+    recent_label: str | None = None,
+) -> Session | None:
+    """
+    Resolve the session a command should act on.
+    
+    An explicit session_id must exist (exits otherwise). Without one, the
+    current session is used, falling back to the most recently updated one;
+    recent_label is printed with the project name when that fallback is taken.
+    Returns None when there are no sessions at all.
+    """
+    if session_id:
+        session = orchestrator.get_session(session_id)
+        if session is None:
+            console.print(f"[red]✗ Session not found:[/] {session_id}")
+            raise typer.Exit(1)
+        return session
+    
+    session = orchestrator.session_manager.current
+    if session is None:
+        session = orchestrator.get_most_recent_session()
+        if session is not None and recent_label:
+            console.print(f"[dim]{recent_label}:[/] {session.project.name}")
+    return session
+
+
 def interactive_approval(message: str, decision: RoutingDecision) -> bool:
     """Prompt user for approval."""
+    from rich.prompt import Confirm
+    
     console.print(f"\n[yellow]⚠ {message}[/]")
     console.print(f"[dim]Agent: {decision.agent_name} | Task: {decision.task_type.value}[/]")
     return Confirm.ask("Proceed?", default=True)
@@ -50,11 +183,21 @@ def interactive_approval(message: str, decision: RoutingDecision) -> bool:
 
 # Map agent names to their primary task types for --agent flag
 AGENT_TASK_MAP = {
-    "architect": TaskType.GAME_CONCEPT,
-    "designer": TaskType.MECHANIC_DESIGN,
-    "developer_2d": TaskType.IMPLEMENT_FEATURE_2D,
-    "developer_3d": TaskType.IMPLEMENT_FEATURE_3D,
-    "qa": TaskType.REVIEW,
+    "architect": "game_concept",
+    "designer": "mechanic_design",
+    "developer_2d": "implement_feature_2d",
+    "developer_3d": "implement_feature_3d",
+    "qa": "review",
+}
+_AGENT_NAMES_CSV = ", ".join(AGENT_TASK_MAP)
+
+# Model and role descriptions shown by `gads agents`
+AGENT_INFO = {
+    "architect": ("Claude Opus", "High-level game design, system architecture, creative direction"),
+    "designer": ("Ollama", "Game mechanics, level design, balancing"),
+    "developer_2d": ("Ollama", "GDScript for 2D games, scenes, physics"),
+    "developer_3d": ("Ollama", "GDScript for 3D games, cameras, lighting"),
+    "qa": ("Ollama", "Testing, validation, code review"),
 }
 
 
@@ -69,20 +212,14 @@ def new_project(
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip approval prompts"),
 ) -> None:
     """Create a new game project with AI-assisted design."""
-    logger = get_logger(__name__)
+    from .orchestrator import TaskType
     
     # Determine project type (--3d overrides --2d)
     project_type = "3d" if is_3d else "2d"
     
     # Set up approval callback
-    if yes:
-        orchestrator = get_orchestrator()
-    else:
-        settings = load_settings()
-        setup_logging(settings.log_level, settings.log_file)
-        global _orchestrator
-        _orchestrator = Orchestrator(settings=settings, approval_callback=interactive_approval)
-        orchestrator = _orchestrator
+    orchestrator = get_orchestrator()
+    orchestrator.set_approval_callback(None if yes else interactive_approval)
     
     console.print(f"\n[bold green]Creating new project:[/] {name} ({project_type.upper()})")
     if description:
@@ -100,8 +237,8 @@ def new_project(
         if prompt:
             console.print(f"\n[bold blue]Consulting Architect agent...[/]\n")
             
-            with console.status("[bold cyan]Thinking...[/]", spinner="dots"):
-                response = asyncio.run(
+            with _status("[bold cyan]Thinking...[/]"):
+                response = _run(
                     orchestrator.run(
                         prompt,
                         session=session,
@@ -109,14 +246,7 @@ def new_project(
                     )
                 )
             
-            # Display response
-            console.print(Panel(
-                Markdown(response.content),
-                title=f"[bold cyan]{response.agent_name}[/]",
-                border_style="cyan",
-            ))
-            
-            _show_artifacts(response.artifacts)
+            _print_response(response)
         
         console.print(f"\n[dim]Use [bold]gads iterate \"your instruction\"[/] to continue development[/]")
         
@@ -134,59 +264,39 @@ def iterate(
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip approval prompts"),
 ) -> None:
     """Iterate on an existing project with a natural language instruction."""
-    logger = get_logger(__name__)
+    from .orchestrator import TaskType
     
     # Validate agent if specified
     if agent and agent not in AGENT_TASK_MAP:
         console.print(f"[red]✗ Unknown agent:[/] {agent}")
-        console.print(f"[dim]Available agents:[/] {', '.join(AGENT_TASK_MAP.keys())}")
+        console.print(f"[dim]Available agents:[/] {_AGENT_NAMES_CSV}")
         raise typer.Exit(1)
     
     # Set up approval callback
-    if yes:
-        orchestrator = get_orchestrator()
-    else:
-        settings = load_settings()
-        setup_logging(settings.log_level, settings.log_file)
-        global _orchestrator
-        _orchestrator = Orchestrator(settings=settings, approval_callback=interactive_approval)
-        orchestrator = _orchestrator
+    orchestrator = get_orchestrator()
+    orchestrator.set_approval_callback(None if yes else interactive_approval)
     
     try:
         # Resolve session
-        session = None
         if session_id:
             console.print(f"[dim]Loading session:[/] {session_id}")
-            session = orchestrator.get_session(session_id)
-            if session is None:
-                console.print(f"[red]✗ Session not found:[/] {session_id}")
-                raise typer.Exit(1)
-        else:
-            # Try current session or most recent
-            session = orchestrator.session_manager.current
-            
-            if session is None:
-                # Load most recent session
-                sessions = orchestrator.list_sessions()
-                if sessions:
-                    session = orchestrator.get_session(sessions[0]["id"])
-                    console.print(f"[dim]Resuming:[/] {session.project.name}")
-                else:
-                    console.print("[red]✗ No sessions found.[/]")
-                    console.print("Create a project first with [bold]gads new-project \"Project Name\"[/]")
-                    raise typer.Exit(1)
+        session = _resolve_session(orchestrator, session_id, recent_label="Resuming")
+        if session is None:
+            console.print("[red]✗ No sessions found.[/]")
+            console.print("Create a project first with [bold]gads new-project \"Project Name\"[/]")
+            raise typer.Exit(1)
         
         console.print(f"\n[bold blue]Processing:[/] {instruction}")
         
         # Determine task type
         task_type = None
         if agent:
-            task_type = AGENT_TASK_MAP[agent]
+            task_type = TaskType(AGENT_TASK_MAP[agent])
             console.print(f"[dim]Using agent:[/] {agent}")
         
         # Execute
-        with console.status("[bold cyan]Thinking...[/]", spinner="dots"):
-            response = asyncio.run(
+        with _status("[bold cyan]Thinking...[/]"):
+            response = _run(
                 orchestrator.run(
                     instruction,
                     session=session,
@@ -194,15 +304,8 @@ def iterate(
                 )
             )
         
-        # Display response
         console.print()
-        console.print(Panel(
-            Markdown(response.content),
-            title=f"[bold cyan]{response.agent_name}[/]",
-            border_style="cyan",
-        ))
-        
-        _show_artifacts(response.artifacts)
+        _print_response(response)
         
     except typer.Exit:
         raise
@@ -212,7 +315,11 @@ def iterate(
         raise typer.Exit(1)
 
 
+_ROLE_STYLE = {"human": "green", "agent": "cyan", "system": "magenta"}
+
+
 @app.command()
+@_buffered_output
 def status(
     session_id: str = typer.Option(None, "--session", "-s", help="Session ID to check"),
 ) -> None:
@@ -221,28 +328,13 @@ def status(
     
     try:
         # Resolve session
-        session = None
-        if session_id:
-            session = orchestrator.get_session(session_id)
-            if session is None:
-                console.print(f"[red]✗ Session not found:[/] {session_id}")
-                raise typer.Exit(1)
-        else:
-            session = orchestrator.session_manager.current
-            if session is None:
-                # Try most recent
-                sessions = orchestrator.list_sessions()
-                if sessions:
-                    session = orchestrator.get_session(sessions[0]["id"])
-        
+        session = _resolve_session(orchestrator, session_id)
         if session is None:
             console.print("\n[yellow]No active session[/]")
             console.print("Create a new project with [bold]gads new-project \"Project Name\"[/]")
             return
         
-        # Build status display
-        console.print(f"\n[bold]GADS Project Status[/]\n")
-        
+        # Build status display, printed as one group
         table = Table(show_header=False, box=None, padding=(0, 2))
         table.add_column("Key", style="dim")
         table.add_column("Value")
@@ -252,30 +344,34 @@ def status(
             table.add_row("Description", session.project.description)
         table.add_row("Session ID", session.id)
         table.add_row("Phase", session.project.current_phase)
-        table.add_row("Messages", str(len(session.history)))
+        table.add_row("Messages", str(session.message_count))
         if session.truncated_message_count > 0:
             table.add_row("Truncated", f"[yellow]{session.truncated_message_count}[/]")
         table.add_row("Created", str(session.created_at)[:19])
         table.add_row("Updated", str(session.updated_at)[:19])
         
-        console.print(table)
+        output: list[RenderableType] = ["\n[bold]GADS Project Status[/]\n", table]
         
         # Show tasks
         if session.project.completed_tasks:
-            console.print(f"\n[green]Completed:[/] {', '.join(session.project.completed_tasks)}")
+            output.append(f"\n[green]Completed:[/] {', '.join(session.project.completed_tasks)}")
         
         if session.project.pending_tasks:
-            console.print(f"[yellow]Pending:[/] {', '.join(session.project.pending_tasks)}")
+            output.append(f"[yellow]Pending:[/] {', '.join(session.project.pending_tasks)}")
         
         # Show recent history
         if session.history:
-            console.print(f"\n[bold]Recent Activity[/]")
+            output.append("\n[bold]Recent Activity[/]")
             for msg in session.get_recent_history(5):
-                role_style = "green" if msg.role == "human" else "cyan"
+                role_style = _ROLE_STYLE.get(msg.role, "cyan")
                 agent_info = f" ({msg.agent_name})" if msg.agent_name else ""
                 content_preview = msg.content[:60] + "..." if len(msg.content) > 60 else msg.content
                 content_preview = content_preview.replace("\n", " ")
-                console.print(f"  [{role_style}]{msg.role}{agent_info}:[/] {content_preview}")
+                output.append(
+                    f"  [{role_style}]{msg.role}{agent_info}:[/] {escape(content_preview)}"
+                )
+        
+        console.print(Group(*output))
         
     except typer.Exit:
         raise
@@ -284,7 +380,11 @@ def status(
         raise typer.Exit(1)
 
 
+_ISO_T_TO_SPACE = str.maketrans("T", " ")
+
+
 @app.command()
+@_buffered_output
 def sessions() -> None:
     """List all saved sessions."""
     orchestrator = get_orchestrator()
@@ -305,17 +405,23 @@ def sessions() -> None:
         table.add_column("Messages", justify="right")
         table.add_column("Updated", style="dim")
         
-        for sess in session_list:
-            table.add_row(
+        rows = [
+            (
                 sess["project_name"],
                 sess["id"][:8] + "...",
                 str(sess.get("message_count", "?")),
-                sess["updated_at"][:19].replace("T", " "),
+                sess["updated_at"][:19].translate(_ISO_T_TO_SPACE),
             )
+            for sess in session_list
+        ]
+        for row in rows:
+            table.add_row(*row)
         
-        console.print(table)
-        console.print(f"\n[dim]Use [bold]gads iterate -s <session_id>[/] to continue a session[/]")
-        console.print(f"[dim]Use [bold]gads status -s <session_id>[/] to view session details[/]")
+        console.print(Group(
+            table,
+            "\n[dim]Use [bold]gads iterate -s <session_id>[/] to continue a session[/]",
+            "[dim]Use [bold]gads status -s <session_id>[/] to view session details[/]",
+        ))
         
     except Exception as e:
         console.print(f"\n[red]✗ Error:[/] {e}")
@@ -323,60 +429,76 @@ def sessions() -> None:
 
 
 @app.command()
+@_buffered_output
 def agents() -> None:
     """List available agents and their roles."""
-    orchestrator = get_orchestrator()
-    
-    agent_info = {
-        "architect": ("Claude Opus", "High-level game design, system architecture, creative direction"),
-        "designer": ("Ollama", "Game mechanics, level design, balancing"),
-        "developer_2d": ("Ollama", "GDScript for 2D games, scenes, physics"),
-        "developer_3d": ("Ollama", "GDScript for 3D games, cameras, lighting"),
-        "qa": ("Ollama", "Testing, validation, code review"),
-    }
-    
-    console.print(f"\n[bold]Available Agents[/]\n")
+    names = get_orchestrator().factory.available_agents
+    rows = [(name, *AGENT_INFO.get(name, ("Unknown", "Unknown"))) for name in names]
     
     table = Table()
     table.add_column("Agent", style="bold cyan")
     table.add_column("Model", style="dim")
     table.add_column("Role")
-    
-    for name in orchestrator.factory.available_agents:
-        model, role = agent_info.get(name, ("Unknown", "Unknown"))
-        table.add_row(name, model, role)
-    
-    console.print(table)
-    console.print(f"\n[dim]Use [bold]gads iterate -a <agent> \"instruction\"[/] to use a specific agent[/]")
+    for row in rows:
+        table.add_row(*row)
+    
+    console.print(Group(
+        Text("\nAvailable Agents\n", style="bold"),
+        table,
+        Text.from_markup(
+            "\n[dim]Use [bold]gads iterate -a <agent> \"instruction\"[/] to use a specific agent[/]"
+        ),
+    ))
+
+
+# Seconds a cached Ollama model list is trusted by `gads check`
+OLLAMA_MODELS_CACHE_TTL = 60
 
 
 @app.command()
 def check() -> None:
     """Check connectivity to required services (Ollama)."""
+    import asyncio
+    
     import aiohttp
     
-    settings = load_settings()
+    from .utils import read_json_cache, write_json_cache
     
-    console.print("\n[bold]GADS Service Health Check[/]\n")
+    settings = _get_settings()
+    models_cache = settings.cache_dir / "ollama_models.json"
     
-    async def check_ollama() -> tuple[bool, str, list[str]]:
+    async def check_ollama(session: aiohttp.ClientSession) -> tuple[bool, str, list[str]]:
         """Check Ollama connectivity."""
+        tags_url = f"{settings.ollama_host}/api/tags"
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{settings.ollama_host}/api/tags",
-                    timeout=aiohttp.ClientTimeout(total=5),
-                ) as resp:
-                    if resp.status != 200:
-                        return False, f"API returned status {resp.status}", []
-                    
-                    data = await resp.json()
-                    models = [m["name"] for m in data.get("models", [])]
-                    
-                    if not models:
-                        return False, "No models installed. Run: ollama pull llama3.2:3b", []
-                    
-                    return True, f"Running with {len(models)} model(s)", models
+            # A recent model list for this host only needs a cheap liveness probe
+            cached = read_json_cache(models_cache)
+            if (
+                cached.get("host") == settings.ollama_host
+                and cached.get("models")
+                and time.time() - cached.get("checked_at", 0) < OLLAMA_MODELS_CACHE_TTL
+            ):
+                async with session.head(tags_url) as resp:
+                    if resp.status == 200:
+                        models = cached["models"]
+                        return True, f"Running with {len(models)} model(s)", models
+            
+            async with session.get(tags_url) as resp:
+                if resp.status != 200:
+                    return False, f"API returned status {resp.status}", []
+                
+                data = await resp.json()
+                models = [m["name"] for m in data.get("models", [])]
+                
+                if not models:
+                    return False, "No models installed. Run: ollama pull llama3.2:3b", []
+                
+                write_json_cache(models_cache, {
+                    "host": settings.ollama_host,
+                    "checked_at": time.time(),
+                    "models": models,
+                })
+                return True, f"Running with {len(models)} model(s)", models
         except asyncio.TimeoutError:
             return False, "Connection timeout. Is Ollama running?", []
         except aiohttp.ClientConnectorError:
@@ -386,27 +508,30 @@ def check() -> None:
     
     async def check_blender() -> tuple[bool, str]:
         """Check Blender availability."""
-        tool = BlenderMCPTool(blender_path=settings.blender_path)
-        try:
-            result = await tool.health_check()
-            if result["available"]:
-                return True, f"Version {result.get('blender_version', 'unknown')}"
-            return False, result.get("error", "Not available")
-        finally:
-            await tool.close()
+        async with _blender_tool_cls()(blender_path=settings.blender_path) as tool:
+            result = await tool.cached_health_check(settings.cache_dir / "blender_health.json")
+        if result["available"]:
+            return True, f"Version {result.get('blender_version', 'unknown')}"
+        return False, result.get("error", "Not available")
     
     async def run_checks():
-        """Run all health checks."""
-        ollama_ok, ollama_msg, ollama_models = await check_ollama()
-        blender_ok, blender_msg = await check_blender()
-        return (
-            (ollama_ok, ollama_msg, ollama_models),
-            (blender_ok, blender_msg),
-        )
+        """Run all health checks concurrently, sharing one HTTP session."""
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=5),
+            connector=aiohttp.TCPConnector(limit=4, ttl_dns_cache=300),
+        ) as session:
+            ollama_result, blender_result = await asyncio.gather(
+                check_ollama(session), check_blender(), return_exceptions=True,
+            )
+        if isinstance(ollama_result, Exception):
+            ollama_result = (False, f"Error: {ollama_result}", [])
+        if isinstance(blender_result, Exception):
+            blender_result = (False, str(blender_result))
+        return ollama_result, blender_result
     
     # Run checks
-    with console.status("[bold cyan]Checking services...[/]", spinner="dots"):
-        ollama_result, blender_result = asyncio.run(run_checks())
+    with _status("[bold cyan]Checking services...[/]"):
+        ollama_result, blender_result = _run(run_checks())
     
     # Display results
     table = Table(show_header=True)
@@ -438,27 +563,51 @@ def check() -> None:
         "[dim]No[/]",
     )
     
-    console.print(table)
-    
     # Summary
     if ollama_ok:
-        console.print("\n[green]✓ Ready to run GADS[/]")
-        console.print("\n[dim]Run end-to-end tests with:[/]")
-        console.print("  pytest tests/test_e2e_ollama.py -v --run-e2e")
+        summary = (
+            "[green]✓ Ready to run GADS[/]\n"
+            "\n[dim]Run end-to-end tests with:[/]\n"
+            "  pytest tests/test_e2e_ollama.py -v --run-e2e"
+        )
     else:
-        console.print("\n[red]✗ Ollama is required but not available[/]")
-        console.print("\n[dim]To start Ollama:[/]")
-        console.print("  1. Install from https://ollama.ai")
-        console.print("  2. Run: [bold]ollama serve[/]")
-        console.print("  3. Pull a model: [bold]ollama pull llama3.2:3b[/]")
-        console.print("     (or any other model you prefer)")
+        summary = (
+            "[red]✗ Ollama is required but not available[/]\n"
+            "\n[dim]To start Ollama:[/]\n"
+            "  1. Install from https://ollama.ai\n"
+            "  2. Run: [bold]ollama serve[/]\n"
+            "  3. Pull a model: [bold]ollama pull llama3.2:3b[/]\n"
+            "     (or any other model you prefer)"
+        )
+    
+    console.print(Group(
+        Text("\nGADS Service Health Check\n", style="bold"),
+        table,
+        Text(""),
+        Text.from_markup(summary),
+    ))
+    
+    if not ollama_ok:
         raise typer.Exit(1)
 
 
-def _show_artifacts(artifacts: dict) -> None:
-    """Display artifact information."""
+# Outputs larger than this are shown as plain text (Markdown parsing gets slow)
+MARKDOWN_RENDER_LIMIT = 8192
+_MARKDOWN_CHARS = frozenset("#*`_[")
+
+
+def _render_output(content: str) -> RenderableType:
+    """Render agent output as Markdown, or plain text when large or unformatted."""
+    if len(content) > MARKDOWN_RENDER_LIMIT or _MARKDOWN_CHARS.isdisjoint(content):
+        return Text(content)
+    from rich.markdown import Markdown
+    return Markdown(content)
+
+
+def _artifacts_summary(artifacts: dict) -> Text | None:
+    """Describe the artifacts in a response, or None if there are none."""
     if not artifacts:
-        return
+        return None
     
     parts = []
     if artifacts.get("gdscript_blocks"):
@@ -469,7 +618,21 @@ def _show_artifacts(artifacts: dict) -> None:
         parts.append("game concept")
     
     if parts:
-        console.print(f"\n[dim]Contains: {', '.join(parts)}[/]")
+        return Text(f"\nContains: {', '.join(parts)}", style="dim")
+    return None
+
+
+def _print_response(response: AgentResponse) -> None:
+    """Display an agent response panel and its artifact summary in one print."""
+    output: list[RenderableType] = [Panel(
+        _render_output(response.content),
+        title=f"[bold cyan]{response.agent_name}[/]",
+        border_style="cyan",
+    )]
+    summary = _artifacts_summary(response.artifacts)
+    if summary:
+        output.append(summary)
+    console.print(Group(*output))
 
 
 # ============================================================================
@@ -490,34 +653,27 @@ def export(
     open_godot: bool = typer.Option(False, "--open", help="Open project in Godot after export"),
 ) -> None:
     """Export a session to a Godot project."""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+    
     from .tools import GodotTool
     
-    logger = get_logger(__name__)
     orchestrator = get_orchestrator()
     
     # Resolve session
-    session = None
-    if session_id:
-        session = orchestrator.get_session(session_id)
-        if session is None:
-            console.print(f"[red]✗ Session not found:[/] {session_id}")
-            raise typer.Exit(1)
-    else:
-        session = orchestrator.session_manager.current
-        if session is None:
-            sessions = orchestrator.list_sessions()
-            if sessions:
-                session = orchestrator.get_session(sessions[0]["id"])
-            else:
-                console.print("[red]✗ No sessions found.[/]")
-                console.print("Create a project first with [bold]gads new-project[/]")
-                raise typer.Exit(1)
-    
-    console.print(f"\n[bold]Exporting:[/] {session.project.name}")
-    console.print(f"[dim]Session:[/] {session.id[:8]}...")
-    console.print(f"[dim]Type:[/] {session.project.project_type.upper()}")
+    session = _resolve_session(orchestrator, session_id)
+    if session is None:
+        console.print("[red]✗ No sessions found.[/]")
+        console.print("Create a project first with [bold]gads new-project[/]")
+        raise typer.Exit(1)
+    
+    header: list[RenderableType] = [
+        f"\n[bold]Exporting:[/] {session.project.name}",
+        f"[dim]Session:[/] {session.id[:8]}...",
+        f"[dim]Type:[/] {session.project.project_type.upper()}",
+    ]
     if session.project.art_style:
-        console.print(f"[dim]Style:[/] {session.project.art_style}")
+        header.append(f"[dim]Style:[/] {session.project.art_style}")
+    console.print(Group(*header))
     
     # Initialize GodotTool
     projects_dir = output if output else orchestrator.settings.godot_projects_dir
@@ -525,7 +681,7 @@ def export(
     
     try:
         # Create project
-        with console.status("[bold cyan]Creating Godot project...[/]", spinner="dots"):
+        with _status("[bold cyan]Creating Godot project...[/]"):
             project_path = tool.create_project(
                 name=session.project.name,
                 project_type=session.project.project_type,
@@ -535,46 +691,69 @@ def export(
         
         console.print(f"[green]✓[/] Project created: {project_path}")
         
-        # Extract and save scripts from session history
+        # Extract scripts from session history
+        blocks = [
+            (i, block)
+            for msg in session.artifact_messages()
+            for i, block in enumerate(msg.metadata["artifacts"].get("gdscript_blocks", []))
+        ]
+        # Try to extract class/script names from content
+        headers = _extract_script_headers(blocks)
+        tasks = [
+            (script_name, extends, block)
+            for (script_name, extends), (_, block) in zip(headers, blocks, strict=True)
+        ]
+        
+        # Later blocks with the same name overwrite earlier ones, so only the
+        # last one per name is written (keeps concurrent saves deterministic)
+        tasks = list({name: (name, extends, block) for name, extends, block in tasks}.values())
+        
+        # Save scripts concurrently with a progress bar
         scripts_saved = 0
-        for msg in session.history:
-            if msg.role == "agent" and msg.metadata.get("artifacts"):
-                artifacts = msg.metadata["artifacts"]
-                gdscript_blocks = artifacts.get("gdscript_blocks", [])
-                
-                for i, block in enumerate(gdscript_blocks):
-                    # Try to extract class/script name from content
-                    script_name = _extract_script_name(block, i)
-                    extends = _extract_extends(block)
-                    
-                    tool.create_script(
-                        project_path,
-                        script_name=script_name,
-                        extends=extends,
-                        content=block,
-                    )
-                    scripts_saved += 1
+        if tasks:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[bold cyan]Saving scripts..."),
+                BarColumn(),
+                TaskProgressColumn(),
+                console=console,
+                transient=True,
+                disable=not console.is_terminal,
+            ) as progress:
+                save_task = progress.add_task("save", total=len(tasks))
+                scripts_saved = _run(_save_scripts_async(
+                    tool,
+                    project_path,
+                    tasks,
+                    on_saved=lambda: progress.advance(save_task),
+                ))
         
+        # The remaining steps are quick, so their output is collected and
+        # printed as one block at the end
+        summary_parts: list[RenderableType] = []
         if scripts_saved > 0:
-            console.print(f"[green]✓[/] Saved {scripts_saved} script(s) to scripts/")
+            summary_parts.append(f"[green]✓[/] Saved {scripts_saved} script(s) to scripts/")
         
         # Add icon
         tool.add_icon(project_path)
-        console.print(f"[green]✓[/] Added project icon")
+        summary_parts.append("[green]✓[/] Added project icon")
         
         # Validate
         validation = tool.validate_project(project_path)
         if validation["valid"]:
-            console.print(f"[green]✓[/] Project validation passed")
+            summary_parts.append("[green]✓[/] Project validation passed")
         else:
-            console.print(f"[yellow]⚠[/] Validation warnings: {validation['warnings']}")
+            summary_parts.append(f"[yellow]⚠[/] Validation warnings: {validation['warnings']}")
         
         # Summary
-        console.print(f"\n[bold green]✓ Export complete![/]")
-        console.print(f"\n[dim]Project location:[/]")
-        console.print(f"  {project_path}")
-        console.print(f"\n[dim]To open in Godot:[/]")
-        console.print(f"  godot --path \"{project_path}\"")
+        summary_parts += [
+            "\n[bold green]✓ Export complete![/]",
+            Text("\nProject location:", style="dim"),
+            f"  {project_path}",
+            Text("\nTo open in Godot:", style="dim"),
+            f"  godot --path \"{project_path}\"",
+        ]
+        console.print(Group(*summary_parts))
         
         # Optionally open in Godot
         if open_godot:
@@ -587,47 +766,88 @@ def export(
         raise typer.Exit(1)
 
 
-def _extract_script_name(content: str, index: int) -> str:
-    """Try to extract a meaningful script name from GDScript content."""
-    lines = content.strip().split("\n")
-    
-    # Look for class_name
-    for line in lines[:10]:
-        if line.startswith("class_name "):
-            name = line.replace("class_name ", "").strip()
-            return name.lower()
-    
-    # Look for extends to guess name
-    for line in lines[:5]:
-        if line.startswith("extends "):
-            base = line.replace("extends ", "").strip()
-            if "CharacterBody" in base:
-                return "player"
-            elif "Area" in base:
-                return "trigger"
-            elif "RigidBody" in base:
-                return "physics_object"
+# Upper bound on script files written at once by `gads export`
+EXPORT_WRITE_CONCURRENCY = 8
+
+
+async def _save_scripts_async(
+    tool: GodotTool,
+    project_path: Path,
+    tasks: list[tuple[str, str, str]],
+    on_saved: Callable[[], None] | None = None,
+) -> int:
+    """Write (script_name, extends, content) tasks concurrently in worker threads."""
+    import asyncio
+    
+    # Create the folder once rather than on every write
+    (project_path / "scripts").mkdir(parents=True, exist_ok=True)
+    semaphore = asyncio.Semaphore(EXPORT_WRITE_CONCURRENCY)
+    
+    async def save(script_name: str, extends: str, content: str) -> None:
+        async with semaphore:
+            await asyncio.to_thread(
+                tool.create_script,
+                project_path,
+                script_name=script_name,
+                extends=extends,
+                content=content,
+                ensure_dir=False,
+            )
+        if on_saved:
+            on_saved()
     
-    # Fallback
-    return f"script_{index}"
+    await asyncio.gather(*(save(*task) for task in tasks))
+    return len(tasks)
+
 
+# `class_name Foo` / `extends Bar` declarations at the start of a line
+_HEADER_RE = re.compile(r"^(class_name|extends)[ \t]+(\S+)", re.M)
 
-def _extract_extends(content: str) -> str:
-    """Extract the extends clause from GDScript content."""
-    for line in content.strip().split("\n")[:5]:
-        if line.startswith("extends "):
-            return line.replace("extends ", "").strip()
-    return "Node"
+# Fallback script names for unnamed scripts, keyed by a substring of the base class
+_BASE_TO_NAME = {
+    "CharacterBody": "player",
+    "Area": "trigger",
+    "RigidBody": "physics_object",
+}
+
+# Header declarations are expected within the first few lines of a script
+_HEADER_SCAN_CHARS = 512
+
+
+def _extract_script_headers(blocks: list[tuple[int, str]]) -> list[tuple[str, str]]:
+    """
+    Extract (script_name, extends) for each (index, content) GDScript block.
+    
+    The start of every block is joined into one buffer and scanned with a
+    single regex pass; matches are mapped back to their block by offset.
+    index is only used to name scripts without a class_name or known base.
+    """
+    prefixes = [content[:_HEADER_SCAN_CHARS] for _, content in blocks]
+    starts = list(itertools.accumulate((len(p) + 1 for p in prefixes[:-1]), initial=0))
+    
+    found: list[dict[str, str]] = [{} for _ in blocks]
+    for match in _HEADER_RE.finditer("\n".join(prefixes)):
+        found[bisect.bisect_right(starts, match.start()) - 1].setdefault(match[1], match[2])
+    
+    headers = []
+    for (index, _), header in zip(blocks, found, strict=True):
+        extends = header.get("extends")
+        if "class_name" in header:
+            name = header["class_name"].lower()
+        else:
+            name = next(
+                (v for k, v in _BASE_TO_NAME.items() if extends and k in extends),
+                f"script_{index}",
+            )
+        headers.append((name, extends or "Node"))
+    return headers
 
 
 @pipeline_app.command("list")
+@_buffered_output
 def pipeline_list() -> None:
     """List all available pipelines."""
-    from pathlib import Path
-    
-    # Find templates directory
-    templates_dir = Path.cwd() / "templates"
-    registry = PipelineRegistry(templates_dir=templates_dir)
+    registry = _pipeline_registry()
     
     pipelines = registry.list()
     
@@ -656,13 +876,13 @@ def pipeline_run(
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip approval prompts"),
 ) -> None:
     """Run a multi-agent pipeline."""
-    from pathlib import Path
+    from rich.live import Live
+    from rich.spinner import Spinner
     
-    logger = get_logger(__name__)
+    from .agents import TokenUsage
+    from .orchestrator import PipelineEvent, PipelineStatus
     
-    # Find templates directory
-    templates_dir = Path.cwd() / "templates"
-    registry = PipelineRegistry(templates_dir=templates_dir)
+    registry = _pipeline_registry()
     
     # Get pipeline
     pipeline = registry.get(name)
@@ -672,35 +892,16 @@ def pipeline_run(
         raise typer.Exit(1)
     
     # Set up orchestrator
-    if yes:
-        orchestrator = get_orchestrator()
-    else:
-        settings = load_settings()
-        setup_logging(settings.log_level, settings.log_file)
-        global _orchestrator
-        _orchestrator = Orchestrator(settings=settings, approval_callback=interactive_approval)
-        orchestrator = _orchestrator
+    orchestrator = get_orchestrator()
+    orchestrator.set_approval_callback(None if yes else interactive_approval)
     
-    # Resolve session
-    session = None
+    # Resolve session (current, most recent, or a new one for this pipeline)
+    session = _resolve_session(orchestrator, session_id, recent_label="Using recent session")
     if session_id:
-        session = orchestrator.get_session(session_id)
-        if session is None:
-            console.print(f"[red]✗ Session not found:[/] {session_id}")
-            raise typer.Exit(1)
         console.print(f"[dim]Resuming session:[/] {session.project.name}")
-    else:
-        # Try current session or create new
-        session = orchestrator.session_manager.current
-        if session is None:
-            sessions = orchestrator.list_sessions()
-            if sessions:
-                session = orchestrator.get_session(sessions[0]["id"])
-                console.print(f"[dim]Using recent session:[/] {session.project.name}")
-            else:
-                # Create new session for this pipeline
-                session = orchestrator.new_project(f"Pipeline: {name}", f"Created for {name} pipeline")
-                console.print(f"[dim]Created new session:[/] {session.id[:8]}...")
+    elif session is None:
+        session = orchestrator.new_project(f"Pipeline: {name}", f"Created for {name} pipeline")
+        console.print(f"[dim]Created new session:[/] {session.id[:8]}...")
     
     # Display pipeline info
     console.print(f"\n[bold]Pipeline:[/] {pipeline.name}")
@@ -713,90 +914,92 @@ def pipeline_run(
     total_output_tokens = 0
     total_cost = 0.0
     step_outputs: dict[str, str] = {}
-    current_spinner = None
+    # Per-token (input, output) rates, looked up once per model
+    rates_by_model: dict[str, tuple[float, float]] = {}
+    
+    # One row per step, updated in place as events arrive: [agent, status, details]
+    rows: dict[str, list[RenderableType]] = {
+        step.name: ["", Text("· pending", style="dim"), ""] for step in pipeline.steps
+    }
+    
+    def render_steps() -> Table:
+        """Render the current state of every step as a table."""
+        table = Table(box=None, show_header=False, pad_edge=False)
+        table.add_column(style="bold cyan", no_wrap=True)
+        table.add_column(style="dim", no_wrap=True)
+        table.add_column(no_wrap=True)
+        table.add_column(style="dim")
+        for index, (step_name, row) in enumerate(rows.items(), 1):
+            table.add_row(f"{index}/{len(rows)} {step_name}", *row)
+        return table
+    
+    # The live display is transient; the final table is printed once afterwards
+    live = Live(
+        get_renderable=render_steps,
+        console=console,
+        transient=True,
+        refresh_per_second=8,
+    ) if console.is_terminal else None
     
     def handle_progress(event: str, data: dict) -> None:
-        """Handle progress events from pipeline execution."""
-        nonlocal total_input_tokens, total_output_tokens, total_cost, current_spinner
+        """Record progress events from pipeline execution in the step table."""
+        nonlocal total_input_tokens, total_output_tokens, total_cost
+        
+        row = rows[data["step"]] if "step" in data else None
         
         if event == PipelineEvent.STEP_START:
-            # Stop any existing spinner before printing
-            if current_spinner:
-                current_spinner.stop()
-                current_spinner = None
-            
-            step_num = data["step_index"]
-            total = data["total_steps"]
-            step_name = data["step"]
-            agent = data["agent"]
-            
-            console.print(f"\n[bold cyan]Step {step_num}/{total}:[/] {step_name} [dim]({agent})[/]")
-            # Don't start spinner here - wait for LLM_CALL_START
+            row[0] = data["agent"]
+            row[1] = Text("⏳ starting", style="cyan")
             
         elif event == PipelineEvent.LLM_CALL_START:
-            # Start spinner right before LLM call
-            current_spinner = console.status("  [dim]→ Calling LLM...[/]", spinner="dots")
-            current_spinner.start()
+            row[1] = Spinner("dots", Text("calling LLM", style="cyan"), style="cyan")
+            if live:
+                live.start()
             
         elif event == PipelineEvent.STEP_COMPLETE:
-            # Stop spinner before output
-            if current_spinner:
-                current_spinner.stop()
-                current_spinner = None
-            
             usage: TokenUsage | None = data.get("usage")
             model = data.get("model", "unknown")
-            step_name = data["step"]
+            row[1] = Text("✓ complete", style="green")
             
             if usage:
-                cost = usage.estimate_cost(model)
+                rates = rates_by_model.get(model)
+                if rates is None:
+                    rates = rates_by_model[model] = TokenUsage.rates_for(model)
+                cost = usage.input_tokens * rates[0] + usage.output_tokens * rates[1]
                 total_input_tokens += usage.input_tokens
                 total_output_tokens += usage.output_tokens
                 total_cost += cost
-                
-                console.print(
-                    f"  [green]✓[/] Complete "
-                    f"[dim]({usage.input_tokens:,} in / {usage.output_tokens:,} out, ${cost:.4f})[/]"
-                )
-            else:
-                console.print(f"  [green]✓[/] Complete")
+                row[2] = f"{usage.input_tokens:,} in / {usage.output_tokens:,} out, ${cost:.4f}"
             
             # Store output for final display
             if data.get("output_preview"):
-                step_outputs[step_name] = data["output_preview"]
+                step_outputs[data["step"]] = data["output_preview"]
                 
         elif event == PipelineEvent.STEP_SKIPPED:
-            # Stop spinner if running
-            if current_spinner:
-                current_spinner.stop()
-                current_spinner = None
-            console.print(f"  [yellow]○[/] Skipped: {data['step']} (condition not met)")
+            row[1] = Text("○ skipped", style="yellow")
+            row[2] = "condition not met"
             
         elif event == PipelineEvent.APPROVAL_NEEDED:
-            # Stop spinner BEFORE prompting for approval
-            if current_spinner:
-                current_spinner.stop()
-                current_spinner = None
+            # Pause the display BEFORE prompting for approval
+            if live:
+                live.stop()
+            row[1] = Text("⚠ awaiting approval", style="yellow")
             console.print(f"  [yellow]⚠ Approval required for {data['step']}[/]")
             
         elif event == PipelineEvent.APPROVAL_GRANTED:
-            console.print(f"  [green]✓[/] Approved")
-            # Spinner will be started by LLM_CALL_START event
+            row[1] = Text("✓ approved", style="green")
+            # The display resumes with the next LLM_CALL_START event
             
         elif event == PipelineEvent.APPROVAL_DENIED:
-            console.print(f"  [red]✗[/] Denied")
+            row[1] = Text("✗ denied", style="red")
             
         elif event == PipelineEvent.PIPELINE_FAILED:
-            if current_spinner:
-                current_spinner.stop()
-                current_spinner = None
-            console.print(f"\n  [red]✗ Failed at {data['step']}:[/] {data['error']}")
-            if data.get("completed_steps"):
-                console.print(f"  [dim]Completed before failure: {', '.join(data['completed_steps'])}[/]")
+            row[1] = Text("✗ failed", style="red")
+            row[2] = data["error"]
     
     # Run the pipeline with progress callback
     try:
-        result = asyncio.run(
+        result = _run(
             orchestrator.run_pipeline(
                 pipeline,
                 session=session,
@@ -805,11 +1008,10 @@ def pipeline_run(
             )
         )
         
-        # Ensure spinner is stopped
-        if current_spinner:
-            current_spinner.stop()
-        
-        # Summary
+        # Final state of every step, then the summary
+        if live:
+            live.stop()
+        console.print(render_steps())
         console.print(f"\n{'=' * 60}")
         
         if result.status == PipelineStatus.COMPLETED:
@@ -842,8 +1044,8 @@ def pipeline_run(
         raise
     except Exception as e:
         logger.exception("Pipeline execution failed")
-        if current_spinner:
-            current_spinner.stop()
+        if live:
+            live.stop()
         console.print(f"\n[red]✗ Error:[/] {e}")
         raise typer.Exit(1)
 
@@ -859,22 +1061,28 @@ blender_app = typer.Typer(
 app.add_typer(blender_app, name="blender")
 
 
+def _validate_primitive(primitive: str) -> None:
+    """Reject unknown primitive types before any Blender or session setup."""
+    from .tools.blender_mcp import PRIMITIVE_OPS
+    
+    if primitive.lower() not in PRIMITIVE_OPS:
+        console.print(f"[red]✗ Error:[/] Unknown primitive type: {primitive}. "
+                      f"Available: {', '.join(PRIMITIVE_OPS)}")
+        raise typer.Exit(1)
+
+
 @blender_app.command("check")
 def blender_check() -> None:
     """Check Blender availability."""
-    settings = load_settings()
-    tool = BlenderMCPTool(blender_path=settings.blender_path)
+    settings = _get_settings()
     
     console.print("\n[bold]Blender Check[/]\n")
     
     async def run_check():
-        try:
-            result = await tool.health_check()
-            return result
-        finally:
-            await tool.close()
+        async with _blender_tool_cls()(blender_path=settings.blender_path) as tool:
+            return await tool.cached_health_check(settings.cache_dir / "blender_health.json")
     
-    result = asyncio.run(run_check())
+    result = _run(run_check())
     
     if result["available"]:
         console.print(f"[green]✓ Blender found[/]")
@@ -883,13 +1091,38 @@ def blender_check() -> None:
         console.print("\n[green]✓ Ready to create placeholder assets![/]")
     else:
         console.print(f"[red]✗ Cannot find Blender:[/] {result.get('error', 'Unknown error')}")
-        console.print(f"\n[dim]Make sure Blender is installed and in your PATH:[/]")
-        console.print(f"  1. Install Blender from https://www.blender.org/download/")
-        console.print(f"  2. Add Blender to your system PATH")
-        console.print(f"  3. Or set BLENDER_PATH in .env")
+        console.print(
+            "\n[dim]Make sure Blender is installed and in your PATH:[/]\n"
+            "  1. Install Blender from https://www.blender.org/download/\n"
+            "  2. Add Blender to your system PATH\n"
+            "  3. Or set BLENDER_PATH in .env"
+        )
         raise typer.Exit(1)
 
 
+async def _do_create(
+    primitive: str,
+    name: str | None,
+    output: str | None,
+    scale: float,
+    settings: Settings,
+) -> str | Path:
+    """Create a primitive, exporting it to GLB when output is given."""
+    async with _blender_tool_cls()(blender_path=settings.blender_path) as tool:
+        if output:
+            return await tool.create_and_export_primitive(
+                primitive_type=primitive,
+                output_path=output,
+                name=name,
+                scale=(scale, scale, scale),
+            )
+        return await tool.create_primitive(
+            primitive_type=primitive,
+            name=name,
+            scale=(scale, scale, scale),
+        )
+
+
 @blender_app.command("create")
 def blender_create(
     primitive: str = typer.Argument(..., help="Primitive type (cube, sphere, cylinder, plane, cone, torus, monkey)"),
@@ -898,38 +1131,19 @@ def blender_create(
     scale: float = typer.Option(1.0, "--scale", "-s", help="Uniform scale"),
 ) -> None:
     """Create a primitive mesh and optionally export to GLB."""
-    settings = load_settings()
-    tool = BlenderMCPTool(blender_path=settings.blender_path)
-    
-    async def run_create():
-        try:
-            if output:
-                return await tool.create_and_export_primitive(
-                    primitive_type=primitive,
-                    output_path=output,
-                    name=name,
-                    scale=(scale, scale, scale),
-                )
-            else:
-                obj_name = await tool.create_primitive(
-                    primitive_type=primitive,
-                    name=name,
-                    scale=(scale, scale, scale),
-                )
-                return obj_name
-        finally:
-            await tool.close()
+    _validate_primitive(primitive)
+    settings = _get_settings()
     
     try:
-        with console.status("[bold cyan]Creating...[/]", spinner="dots"):
-            result = asyncio.run(run_create())
+        with _status("[bold cyan]Creating...[/]"):
+            result = _run(_do_create(primitive, name, output, scale, settings))
         
         if output:
             console.print(f"[green]✓ Created and exported:[/] {result}")
         else:
             console.print(f"[green]✓ Created:[/] {result}")
             console.print(f"[dim]Scale:[/] {scale}")
-            console.print(f"\n[dim]Use --output to export to GLB[/]")
+            console.out("\nUse --output to export to GLB", style="dim", highlight=False)
         
     except ValueError as e:
         console.print(f"[red]✗ Error:[/] {e}")
@@ -939,6 +1153,75 @@ def blender_create(
         raise typer.Exit(1)
 
 
+def _parse_batch_entry(entry: dict[str, Any]) -> dict[str, Any]:
+    """Turn one batch spec entry into create_and_export_primitives() arguments."""
+    primitive = entry["primitive"]
+    output = entry["output"]
+    name = entry.get("name")
+    scale = entry.get("scale", 1.0)
+    if not isinstance(primitive, str):
+        raise TypeError(f"'primitive' must be a string, got {primitive!r}")
+    if not isinstance(output, str):
+        raise TypeError(f"'output' must be a string, got {output!r}")
+    if name is not None and not isinstance(name, str):
+        raise TypeError(f"'name' must be a string, got {name!r}")
+    if isinstance(scale, bool) or not isinstance(scale, (int, float)):
+        raise TypeError(f"'scale' must be a number, got {scale!r}")
+    return {
+        "primitive_type": primitive,
+        "output_path": output,
+        "name": name,
+        "scale": (scale,) * 3,
+    }
+
+
+@blender_app.command("batch")
+def blender_batch(
+    spec: Path = typer.Option(..., "--spec", help="JSON file listing primitives to create"),
+) -> None:
+    """Create and export several primitives in a single Blender run."""
+    import json
+    
+    try:
+        entries = json.loads(spec.read_text(encoding="utf-8"))
+        specs = [_parse_batch_entry(entry) for entry in entries]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        console.print(f"[red]✗ Invalid spec file:[/] {e}")
+        raise typer.Exit(1)
+    
+    for entry in specs:
+        _validate_primitive(entry["primitive_type"])
+    
+    settings = _get_settings()
+    
+    async def run_batch():
+        async with _blender_tool_cls()(blender_path=settings.blender_path) as tool:
+            return await tool.create_and_export_primitives(specs)
+    
+    try:
+        with _status(f"[bold cyan]Creating {len(specs)} primitive(s)...[/]"):
+            paths = _run(run_batch())
+        
+        console.print(Group(*(Text(f"✓ Exported: {path}", style="green") for path in paths)))
+    
+    except Exception as e:
+        console.print(f"\n[red]✗ Error:[/] {e}")
+        raise typer.Exit(1)
+
+
+# Export format -> coroutine running the matching BlenderMCPTool export
+_EXPORT_FORMATS: dict[
+    str, Callable[[BlenderMCPTool, str, str | None], Coroutine[Any, Any, Path]]
+] = {
+    "glb": lambda tool, output, blend_file: tool.export_gltf(output, blend_file, False, "GLB"),
+    "gltf": lambda tool, output, blend_file: tool.export_gltf(
+        output, blend_file, False, "GLTF_SEPARATE"
+    ),
+    "fbx": lambda tool, output, blend_file: tool.export_fbx(output, blend_file, False),
+    "obj": lambda tool, output, blend_file: tool.export_obj(output, blend_file, False),
+}
+
+
 @blender_app.command("export")
 def blender_export(
     output: str = typer.Argument(..., help="Output file path"),
@@ -946,26 +1229,20 @@ def blender_export(
     format: str = typer.Option("glb", "--format", help="Export format (glb, gltf, fbx, obj)"),
 ) -> None:
     """Export a .blend file to GLB/FBX/OBJ."""
-    settings = load_settings()
-    tool = BlenderMCPTool(blender_path=settings.blender_path)
+    export = _EXPORT_FORMATS.get(format.lower())
+    if export is None:
+        console.print(f"[red]✗ Error:[/] Unsupported format: {format}. Use glb, gltf, fbx, or obj.")
+        raise typer.Exit(1)
+    
+    settings = _get_settings()
     
     async def run_export():
-        try:
-            if format.lower() in ["glb", "gltf"]:
-                export_format = "GLB" if format.lower() == "glb" else "GLTF_SEPARATE"
-                return await tool.export_gltf(output, blend_file, False, export_format)
-            elif format.lower() == "fbx":
-                return await tool.export_fbx(output, blend_file, False)
-            elif format.lower() == "obj":
-                return await tool.export_obj(output, blend_file, False)
-            else:
-                raise ValueError(f"Unsupported format: {format}. Use glb, gltf, fbx, or obj.")
-        finally:
-            await tool.close()
+        async with _blender_tool_cls()(blender_path=settings.blender_path) as tool:
+            return await export(tool, output, blend_file)
     
     try:
-        with console.status("[bold cyan]Exporting...[/]", spinner="dots"):
-            output_path = asyncio.run(run_export())
+        with _status("[bold cyan]Exporting...[/]"):
+            output_path = _run(run_export())
         
         console.print(f"[green]✓ Exported to:[/] {output_path}")
         
@@ -974,6 +1251,62 @@ def blender_export(
         raise typer.Exit(1)
 
 
+# Project paths already confirmed to contain a project.godot. Only positive
+# results are kept, so a project created later in a `gads shell` is found.
+_godot_projects: set[str] = set()
+
+
+def _is_godot_project(project_path: str) -> bool:
+    """Check (once per process for valid projects) that a path holds a Godot project."""
+    if project_path in _godot_projects:
+        return True
+    if os.path.isfile(os.path.join(project_path, "project.godot")):
+        _godot_projects.add(project_path)
+        return True
+    return False
+
+
+def _resolve_godot_project(
+    project_path: str | None,
+    session_id: str | None,
+    settings: Settings,
+) -> Path:
+    """Resolve the target Godot project from --project or from a session's export."""
+    if project_path:
+        if not _is_godot_project(project_path):
+            console.print(f"[red]✗ Not a valid Godot project:[/] {project_path}")
+            raise typer.Exit(1)
+        return Path(project_path)
+    
+    # Get from session
+    session = _resolve_session(get_orchestrator(), session_id)
+    if session is None:
+        console.print("[red]✗ No session found.[/]")
+        console.print("[dim]Use --project to specify a Godot project path directly[/]")
+        raise typer.Exit(1)
+    
+    from .tools import GodotTool
+    
+    # Look for the most recent export (re-exports get a _YYYYmmdd_HHMMSS suffix)
+    safe_name = GodotTool._sanitize_name(session.project.name)
+    export_name = re.compile(rf"{re.escape(safe_name)}(_\d{{8}}_\d{{6}})?")
+    try:
+        with os.scandir(settings.godot_projects_dir) as entries:
+            best = max(
+                (e for e in entries if export_name.fullmatch(e.name) and e.is_dir()),
+                key=lambda e: e.stat().st_mtime,
+                default=None,
+            )
+    except FileNotFoundError:
+        best = None
+    
+    if best is None:
+        console.print(f"[yellow]Project not exported yet. Run:[/] gads export")
+        raise typer.Exit(1)
+    
+    return Path(best.path)
+
+
 @blender_app.command("to-project")
 def blender_to_project(
     primitive: str = typer.Argument(..., help="Primitive type (cube, sphere, cylinder, plane, cone, torus, monkey)"),
@@ -983,58 +1316,21 @@ def blender_to_project(
     session_id: str = typer.Option(None, "--session", help="Session ID to get project from"),
 ) -> None:
     """Create a primitive and export directly to a Godot project."""
-    logger = get_logger(__name__)
-    settings = load_settings()
-    
-    # Determine project path
-    godot_project = None
-    if project_path:
-        godot_project = Path(project_path)
-        if not (godot_project / "project.godot").exists():
-            console.print(f"[red]✗ Not a valid Godot project:[/] {project_path}")
-            raise typer.Exit(1)
-    else:
-        # Get from session
-        orchestrator = get_orchestrator()
-        session = None
-        if session_id:
-            session = orchestrator.get_session(session_id)
-        else:
-            session = orchestrator.session_manager.current
-            if session is None:
-                sessions = orchestrator.list_sessions()
-                if sessions:
-                    session = orchestrator.get_session(sessions[0]["id"])
-        
-        if session is None:
-            console.print("[red]✗ No session found.[/]")
-            console.print("[dim]Use --project to specify a Godot project path directly[/]")
-            raise typer.Exit(1)
-        
-        # Look for exported project
-        safe_name = session.project.name.lower().replace(" ", "_")
-        godot_project = Path(settings.godot_projects_dir) / safe_name
-        
-        if not godot_project.exists():
-            console.print(f"[yellow]Project not exported yet. Run:[/] gads export")
-            raise typer.Exit(1)
+    _validate_primitive(primitive)
+    settings = _get_settings()
+    godot_project = _resolve_godot_project(project_path, session_id, settings)
     
     # Determine output path
     output_path = godot_project / "assets" / "models" / f"{name}.glb"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    tool = BlenderMCPTool(blender_path=settings.blender_path)
     
     async def run_create():
-        try:
+        async with _blender_tool_cls()(blender_path=settings.blender_path) as tool:
             return await tool.create_and_export_primitive(
                 primitive_type=primitive,
                 output_path=output_path,
                 name=name,
                 scale=(scale, scale, scale),
             )
-        finally:
-            await tool.close()
     
     try:
         console.print(f"\n[bold]Creating {primitive} for Godot Project[/]\n")
@@ -1043,11 +1339,15 @@ def blender_to_project(
         console.print(f"[dim]Scale:[/] {scale}")
         console.print()
         
-        with console.status("[bold cyan]Creating and exporting...[/]", spinner="dots"):
-            result_path = asyncio.run(run_create())
+        with _status("[bold cyan]Creating and exporting...[/]"):
+            result_path = _run(run_create())
         
         console.print(f"[green]✓ Created:[/] {result_path}")
-        console.print(f"\n[dim]The model will be auto-imported when you open the project in Godot.[/]")
+        console.out(
+            "\nThe model will be auto-imported when you open the project in Godot.",
+            style="dim",
+            highlight=False,
+        )
         
     except ValueError as e:
         console.print(f"[red]✗ Error:[/] {e}")
@@ -1058,6 +1358,50 @@ def blender_to_project(
         raise typer.Exit(1)
 
 
+# ============================================================================
+# Interactive Shell
+# ============================================================================
+
+@app.command()
+def shell() -> None:
+    """Run several commands in one process, reusing settings, sessions and the event loop."""
+    import shlex
+    
+    import typer.main
+    
+    command = typer.main.get_command(app)
+    console.print("\n[bold]GADS shell[/] [dim](enter commands without 'gads'; 'exit' to quit)[/]\n")
+    
+    while True:
+        try:
+            line = console.input("[bold cyan]gads>[/] ")
+        except (EOFError, KeyboardInterrupt):
+            console.print()
+            break
+        
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            console.print(f"[red]✗ Error:[/] {e}")
+            continue
+        
+        if not args:
+            continue
+        if args[0] in ("exit", "quit"):
+            break
+        if args[0] == "shell":
+            console.print("[yellow]Already in the GADS shell[/]")
+            continue
+        
+        try:
+            # Commands report their own failures; typer.Exit is returned, not raised
+            command.main(args=args, prog_name="gads", standalone_mode=False)
+        except (typer.Abort, KeyboardInterrupt):
+            console.print("\n[yellow]Aborted[/]")
+        except typer.TyperException as e:
+            console.print(f"[red]✗ Error:[/] {escape(e.format_message())}")
+
+
 def main() -> None:
     """Entry point for the CLI."""
     app()
@@ -6,14 +6,19 @@ Central coordinator that ties together agents, sessions, routing, and pipelines.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
+import os
+from collections.abc import Awaitable, Callable
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any
 
 from ..agents import AgentFactory, AgentResponse, BaseAgent, TokenUsage
-from ..utils import Settings, load_settings, get_logger
-from .session import Session, SessionManager, Message
-from .router import AgentRouter, TaskType, RoutingDecision
-from .pipeline import Pipeline, PipelineResult, PipelineStatus
+from ..utils import Settings, get_logger, load_settings
+from .pipeline import Pipeline, PipelineResult, PipelineStatus, PipelineStep
+from .router import AgentRouter, RoutingDecision, TaskType
+from .session import Message, Session, SessionManager
 
 
 class PipelineEvent:
@@ -31,6 +36,30 @@ class PipelineEvent:
 
 logger = get_logger(__name__)
 
+# Approval gate: receives (message, decision) and returns, or resolves to, True to proceed
+ApprovalCallback = Callable[[str, RoutingDecision], bool | Awaitable[bool]]
+
+# Characters of step output included in STEP_COMPLETE progress events
+OUTPUT_PREVIEW_CHARS = 200
+
+
+@functools.cache
+def _find_package_config_dir() -> Path | None:
+    """Walk up from this file to the project root holding config/ (searched once per process)."""
+    current = os.path.dirname(os.path.abspath(__file__))
+    for _ in range(5):  # Max 5 levels up
+        if os.path.exists(os.path.join(current, "config")):
+            return Path(current)
+        current = os.path.dirname(current)
+    return None
+
+
+def _preview(text: str, limit: int = OUTPUT_PREVIEW_CHARS) -> str:
+    """Shorten text for progress events (only the first limit chars are copied)."""
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "..."
+
 
 class Orchestrator:
     """
@@ -47,7 +76,7 @@ class Orchestrator:
         self,
         settings: Settings | None = None,
         config_dir: Path | str | None = None,
-        approval_callback: Callable[[str, RoutingDecision], bool] | None = None,
+        approval_callback: ApprovalCallback | None = None,
     ):
         """
         Initialize the orchestrator.
@@ -57,6 +86,8 @@ class Orchestrator:
             config_dir: Directory containing config/ and prompts/ (auto-detected if not provided)
             approval_callback: Optional callback for human approval gates.
                                Receives (message, decision) and returns True to proceed.
+                               May be async, so a UI can wait for input without
+                               blocking other work on the event loop.
         """
         self.settings = settings or load_settings()
         self.config_dir = self._resolve_config_dir(config_dir)
@@ -66,10 +97,14 @@ class Orchestrator:
         self.session_manager = SessionManager(
             self.settings.session_dir,
             max_history=self.settings.max_session_history,
+            cache_size=self.settings.session_cache_size,
         )
         self.factory = self._create_factory()
         self.agents = self.factory.create_all_agents()
         self.router = self._create_router()
+        # Shared by run() and every run_pipeline() so concurrent callers can't
+        # flood the model providers
+        self._llm_semaphore = asyncio.Semaphore(max(1, self.settings.max_concurrent_llm_calls))
         
         agent_names = ", ".join(self.factory.available_agents)
         logger.info(f"Orchestrator initialized with {len(self.agents)} agents: {agent_names}")
@@ -79,16 +114,9 @@ class Orchestrator:
         if config_dir:
             return Path(config_dir)
         
-        # Try to find config dir relative to package
-        # Walk up from this file to find project root
-        current = Path(__file__).parent
-        for _ in range(5):  # Max 5 levels up
-            if (current / "config").exists():
-                return current
-            current = current.parent
-        
-        # Fallback to current working directory
-        return Path.cwd()
+        # Try to find config dir relative to package, falling back to the
+        # current working directory
+        return _find_package_config_dir() or Path.cwd()
     
     def _create_factory(self) -> AgentFactory:
         """Create and configure the agent factory."""
@@ -116,6 +144,34 @@ class Orchestrator:
         router.register_agents(self.agents)
         return router
     
+    def clear_classifier_cache(self) -> None:
+        """Forget all cached request classifications."""
+        self.router.clear_cache()
+    
+    async def aclose(self) -> None:
+        """Release network resources (the router's HTTP session)."""
+        await self.router.close()
+    
+    async def __aenter__(self) -> Orchestrator:
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    def set_approval_callback(
+        self,
+        callback: ApprovalCallback | None,
+    ) -> None:
+        """Replace the approval callback (None restores auto-approval)."""
+        self.approval_callback = callback or self._default_approval
+    
+    async def _request_approval(self, message: str, decision: RoutingDecision) -> bool:
+        """Ask the approval callback, awaiting it if it is async."""
+        approved = self.approval_callback(message, decision)
+        if inspect.isawaitable(approved):
+            approved = await approved
+        return bool(approved)
+    
     def _default_approval(self, message: str, decision: RoutingDecision) -> bool:
         """Default approval callback - always approves."""
         logger.debug(f"Auto-approving: {message}")
@@ -143,6 +199,10 @@ class Orchestrator:
         """List all saved sessions."""
         return self.session_manager.list_sessions()
     
+    def get_most_recent_session(self) -> Session | None:
+        """Load the most recently updated session, or None if there are none."""
+        return self.session_manager.load_most_recent()
+    
     def new_project(
         self,
         name: str,
@@ -218,14 +278,14 @@ class Orchestrator:
         # Check for approval if required
         if decision.requires_human_approval:
             approval_msg = f"Task '{task_type.value}' requires approval. Proceed with {decision.agent_name}?"
-            if not self.approval_callback(approval_msg, decision):
+            if not await self._request_approval(approval_msg, decision):
                 response = AgentResponse(
                     content="Task cancelled by user.",
                     agent_name="system",
                     model="",
                 )
                 session.add_message("system", response.content)
-                self.session_manager.save(session)
+                await self.session_manager.save_async(session)
                 return response
         
         # Execute agent
@@ -240,7 +300,7 @@ class Orchestrator:
         )
         
         # Save session
-        self.session_manager.save(session)
+        await self.session_manager.save_async(session)
         
         return response
     
@@ -265,7 +325,8 @@ class Orchestrator:
         
         logger.debug(f"Executing {decision.agent_name} with context keys: {list(context.keys())}")
         
-        response = await agent.execute(user_input, context, history)
+        async with self._llm_semaphore:
+            response = await agent.execute(user_input, context, history)
         
         return response
     
@@ -297,15 +358,7 @@ class Orchestrator:
         max_messages: int = 10,
     ) -> list[dict[str, str]]:
         """Build conversation history in the format agents expect."""
-        history = []
-        
-        for msg in session.get_recent_history(max_messages):
-            if msg.role == "human":
-                history.append({"role": "user", "content": msg.content})
-            elif msg.role == "agent":
-                history.append({"role": "assistant", "content": msg.content})
-        
-        return history
+        return session.get_agent_history(max_messages)
     
     async def run_pipeline(
         self,
@@ -319,7 +372,9 @@ class Orchestrator:
         Execute a multi-agent pipeline.
         
         Pipelines define explicit multi-step workflows where output
-        from one agent becomes input to the next.
+        from one agent becomes input to the next. Steps whose
+        dependencies are satisfied run concurrently, up to
+        ``settings.max_parallel_agents`` LLM calls at a time.
         
         Args:
             pipeline: The pipeline to execute
@@ -350,10 +405,21 @@ class Orchestrator:
             if progress_callback:
                 progress_callback(event, data)
         
+        try:
+            waves = pipeline.waves()
+        except ValueError as e:
+            result.status = PipelineStatus.FAILED
+            result.error = str(e)
+            return result
+        
         logger.info(f"Starting pipeline: {pipeline.name} ({len(pipeline.steps)} steps)")
         total_steps = len(pipeline.steps)
+        step_indices = {step.name: i for i, step in enumerate(pipeline.steps, 1)}
+        semaphore = asyncio.Semaphore(max(1, self.settings.max_parallel_agents))
         
-        for step_index, step in enumerate(pipeline.steps, 1):
+        async def run_step(step: PipelineStep) -> None:
+            """Run one step, recording failure or cancellation on the result."""
+            step_index = step_indices[step.name]
             result.current_step = step.name
             
             # Check condition
@@ -364,7 +430,7 @@ class Orchestrator:
                     "step_index": step_index,
                     "total_steps": total_steps,
                 })
-                continue
+                return
             
             logger.info(f"Executing pipeline step: {step.name}")
             
@@ -376,7 +442,7 @@ class Orchestrator:
                     step_input = context.get("user_input", "")
                 
                 # Route and execute
-                task_type = TaskType(step.task_type)
+                task_type = step.task
                 decision = self.router.route(task_type, session, context)
                 
                 # Emit step start
@@ -396,22 +462,23 @@ class Orchestrator:
                     })
                     
                     approval_msg = f"Pipeline step '{step.name}' requires approval. Proceed?"
-                    if not self.approval_callback(approval_msg, decision):
+                    if not await self._request_approval(approval_msg, decision):
                         emit(PipelineEvent.APPROVAL_DENIED, {"step": step.name})
                         result.status = PipelineStatus.CANCELLED
                         result.error = f"Step '{step.name}' cancelled by user"
-                        return result
+                        return
                     
                     emit(PipelineEvent.APPROVAL_GRANTED, {"step": step.name})
                 
-                # Emit LLM call start (after any approval, right before execution)
-                emit(PipelineEvent.LLM_CALL_START, {
-                    "step": step.name,
-                    "agent": decision.agent_name,
-                })
-                
-                # Execute agent
-                response = await self._execute_agent(decision, str(step_input), session)
+                async with semaphore:
+                    # Emit LLM call start (after any approval, right before execution)
+                    emit(PipelineEvent.LLM_CALL_START, {
+                        "step": step.name,
+                        "agent": decision.agent_name,
+                    })
+                    
+                    # Execute agent
+                    response = await self._execute_agent(decision, str(step_input), session)
                 
                 # Store output
                 if step.output_key:
@@ -437,7 +504,7 @@ class Orchestrator:
                     "agent": response.agent_name,
                     "model": response.model,
                     "usage": response.usage,
-                    "output_preview": response.content[:200] + "..." if len(response.content) > 200 else response.content,
+                    "output_preview": _preview(response.content),
                 })
                 
             except Exception as e:
@@ -445,11 +512,21 @@ class Orchestrator:
                 emit(PipelineEvent.PIPELINE_FAILED, {
                     "step": step.name,
                     "error": str(e),
-                    "completed_steps": result.completed_steps,
+                    "completed_steps": list(result.completed_steps),
                 })
                 result.status = PipelineStatus.FAILED
                 result.error = f"Step '{step.name}' failed: {str(e)}"
-                self.session_manager.save(session)
+        
+        # Steps in a wave are independent; later waves wait for earlier ones
+        for wave in waves:
+            if len(wave) == 1:
+                await run_step(wave[0])
+            else:
+                await asyncio.gather(*(run_step(step) for step in wave))
+            
+            if result.status != PipelineStatus.RUNNING:
+                if result.status == PipelineStatus.FAILED:
+                    await self.session_manager.save_async(session)
                 return result
         
         result.status = PipelineStatus.COMPLETED
@@ -457,7 +534,7 @@ class Orchestrator:
         result.outputs = context
         
         # Save session
-        self.session_manager.save(session)
+        await self.session_manager.save_async(session)
         
         emit(PipelineEvent.PIPELINE_COMPLETE, {
             "steps_completed": len(result.completed_steps),
@@ -6,6 +6,7 @@ Defines multi-agent pipelines for complex workflows.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Callable
@@ -35,6 +36,13 @@ class PipelineStep:
     input_key: str | None = None  # Key to read input from context
     output_key: str | None = None  # Key to store output in context
     condition: Callable[[dict[str, Any]], bool] | None = None  # Optional condition
+    depends_on: list[str] = field(default_factory=list)  # Steps that must finish first
+    
+    @functools.cached_property
+    def task(self) -> TaskType:
+        """The step's task type as a TaskType (converted once per step)."""
+        from .router import TaskType
+        return TaskType(self.task_type)
     
     def should_execute(self, context: dict[str, Any]) -> bool:
         """Check if this step should execute based on condition."""
@@ -74,18 +82,70 @@ class Pipeline:
         input_key: str | None = None,
         output_key: str | None = None,
         condition: Callable[[dict[str, Any]], bool] | None = None,
+        depends_on: list[str] | None = None,
     ) -> Pipeline:
-        """Add a step to the pipeline. Returns self for chaining."""
+        """
+        Add a step to the pipeline. Returns self for chaining.
+        
+        Without explicit ``depends_on`` the step depends on the step that
+        produces its ``input_key``, or else on the previously added step,
+        so steps only run concurrently when their inputs allow it.
+        """
+        if depends_on is None:
+            depends_on = self._infer_depends_on(input_key)
         step = PipelineStep(
             name=name,
             task_type=task_type,
             input_key=input_key,
             output_key=output_key,
             condition=condition,
+            depends_on=list(depends_on),
         )
         self.steps.append(step)
         return self
     
+    def _infer_depends_on(self, input_key: str | None) -> list[str]:
+        """Default dependencies for a new step (see add_step)."""
+        if input_key:
+            for step in reversed(self.steps):
+                if step.output_key == input_key:
+                    return [step.name]
+        return [self.steps[-1].name] if self.steps else []
+    
+    def waves(self) -> list[list[PipelineStep]]:
+        """
+        Group steps into waves that can run concurrently.
+        
+        Every step's dependencies are in an earlier wave; steps keep
+        their definition order within a wave.
+        
+        Raises:
+            ValueError: If a step depends on an unknown step or the
+                dependencies form a cycle
+        """
+        names = {step.name for step in self.steps}
+        for step in self.steps:
+            unknown = set(step.depends_on) - names
+            if unknown:
+                raise ValueError(
+                    f"Step '{step.name}' depends on unknown step(s): {', '.join(sorted(unknown))}"
+                )
+        
+        waves: list[list[PipelineStep]] = []
+        done: set[str] = set()
+        pending = self.steps
+        while pending:
+            ready = [step for step in pending if done.issuperset(step.depends_on)]
+            if not ready:
+                raise ValueError(
+                    f"Pipeline '{self.name}' has a dependency cycle between: "
+                    f"{', '.join(step.name for step in pending)}"
+                )
+            waves.append(ready)
+            done.update(step.name for step in ready)
+            pending = [step for step in pending if step.name not in done]
+        return waves
+    
     async def execute(
         self,
         router: AgentRouter,
@@ -6,16 +6,25 @@ Discovers and manages pipeline templates (built-in and custom YAML).
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+from ..utils import read_json_cache, write_json_cache
 from .pipeline import Pipeline, PipelineStep
 from .router import TaskType
 
-
 logger = logging.getLogger(__name__)
 
 
@@ -108,17 +117,40 @@ def _dict_to_pipeline(data: dict[str, Any]) -> Pipeline:
     )
     
     for step_data in data.get("steps", []):
+        # Reject unknown task types when the pipeline is loaded, not mid-run
+        TaskType(step_data["task_type"])
         pipeline.add_step(
             name=step_data["name"],
             task_type=step_data["task_type"],
             input_key=step_data.get("input_key"),
             output_key=step_data.get("output_key"),
             condition=step_data.get("condition"),
+            depends_on=step_data.get("depends_on"),
         )
     
     return pipeline
 
 
+# Most YAML files whose parsed definitions are kept between registries
+PARSED_CACHE_SIZE = 128
+
+
+def _templates_fingerprint(templates_dir: Path | None) -> str:
+    """Hash the name, mtime and size of each custom pipeline file."""
+    entries: list[tuple[str, int, int]] = []
+    if templates_dir:
+        try:
+            with os.scandir(templates_dir / "pipelines") as it:
+                for entry in it:
+                    if entry.name.endswith(".yaml") and entry.is_file():
+                        st = entry.stat()
+                        entries.append((entry.name, st.st_mtime_ns, st.st_size))
+        except OSError:
+            pass
+    key = repr((str(templates_dir), sorted(entries)))
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
 class PipelineRegistry:
     """
     Registry for discovering and managing pipelines.
@@ -126,6 +158,11 @@ class PipelineRegistry:
     Loads built-in pipelines and custom YAML pipelines from a templates directory.
     """
     
+    # YAML path -> (mtime_ns, parsed definition), shared by all registries so
+    # unchanged files aren't re-read in the same process. Definitions are only
+    # read; each registry builds its own Pipeline objects from them.
+    _parsed_cache: OrderedDict[Path, tuple[int, dict[str, Any]]] = OrderedDict()
+    
     def __init__(self, templates_dir: Path | str | None = None):
         """
         Initialize the registry.
@@ -136,9 +173,50 @@ class PipelineRegistry:
         """
         self.templates_dir = Path(templates_dir) if templates_dir else None
         self._pipelines: dict[str, Pipeline] = {}
+        self._custom_definitions: list[dict[str, Any]] = []
         self._load_builtin_pipelines()
         self._load_custom_pipelines()
     
+    @classmethod
+    def load_cached(
+        cls,
+        templates_dir: Path | str | None,
+        cache_file: Path | None = None,
+    ) -> PipelineRegistry:
+        """
+        Create a registry, reusing parsed custom pipelines from a cache file.
+        
+        The cache is keyed by the name, mtime and size of every YAML file in
+        templates_dir/pipelines/, so editing, adding or removing a pipeline
+        invalidates it.
+        
+        Args:
+            templates_dir: Directory containing custom pipeline YAML files
+            cache_file: JSON file holding parsed definitions (no caching if None)
+        """
+        templates_dir = Path(templates_dir) if templates_dir else None
+        if cache_file is None:
+            return cls(templates_dir)
+        
+        fingerprint = _templates_fingerprint(templates_dir)
+        cached = read_json_cache(cache_file)
+        if cached.get("fingerprint") == fingerprint:
+            registry = cls()
+            registry.templates_dir = templates_dir
+            for data in cached.get("pipelines", []):
+                try:
+                    registry._register_custom(data, source=cache_file)
+                except Exception as e:
+                    logger.error(f"Failed to load cached pipeline '{data.get('name')}': {e}")
+            return registry
+        
+        registry = cls(templates_dir)
+        write_json_cache(cache_file, {
+            "fingerprint": fingerprint,
+            "pipelines": registry._custom_definitions,
+        })
+        return registry
+    
     def _load_builtin_pipelines(self) -> None:
         """Load built-in pipeline definitions."""
         for name, data in BUILTIN_PIPELINES.items():
@@ -155,33 +233,56 @@ class PipelineRegistry:
             return
         
         pipelines_dir = self.templates_dir / "pipelines"
-        if not pipelines_dir.exists():
+        try:
+            with os.scandir(pipelines_dir) as it:
+                yaml_entries = [
+                    entry for entry in it
+                    if entry.name.endswith(".yaml") and not entry.name.startswith(".")
+                ]
+        except FileNotFoundError:
             logger.debug(f"No custom pipelines directory: {pipelines_dir}")
             return
         
-        for yaml_file in pipelines_dir.glob("*.yaml"):
+        for entry in yaml_entries:
+            yaml_file = Path(entry.path)
             try:
-                with open(yaml_file) as f:
-                    data = yaml.safe_load(f)
+                mtime_ns = entry.stat().st_mtime_ns
+                cached = self._parsed_cache.get(yaml_file)
+                if cached is not None and cached[0] == mtime_ns:
+                    self._parsed_cache.move_to_end(yaml_file)
+                    self._register_custom(cached[1], source=yaml_file)
+                    continue
+                
+                with open(yaml_file, "rb") as f:
+                    data = yaml.load(f, Loader=_YamlLoader)
                 
                 if not data or "name" not in data:
                     logger.warning(f"Invalid pipeline file (missing 'name'): {yaml_file}")
                     continue
                 
-                pipeline = _dict_to_pipeline(data)
-                
-                # Custom pipelines override built-ins with same name
-                if pipeline.name in self._pipelines:
-                    logger.info(f"Custom pipeline '{pipeline.name}' overrides built-in")
-                
-                self._pipelines[pipeline.name] = pipeline
-                logger.debug(f"Loaded custom pipeline: {pipeline.name} from {yaml_file}")
+                self._register_custom(data, source=yaml_file)
+                self._parsed_cache[yaml_file] = (mtime_ns, data)
+                self._parsed_cache.move_to_end(yaml_file)
+                while len(self._parsed_cache) > PARSED_CACHE_SIZE:
+                    self._parsed_cache.popitem(last=False)
                 
             except yaml.YAMLError as e:
                 logger.error(f"Failed to parse pipeline YAML '{yaml_file}': {e}")
             except Exception as e:
                 logger.error(f"Failed to load pipeline from '{yaml_file}': {e}")
     
+    def _register_custom(self, data: dict[str, Any], source: Path) -> None:
+        """Build and register a custom pipeline definition."""
+        pipeline = _dict_to_pipeline(data)
+        
+        # Custom pipelines override built-ins with same name
+        if pipeline.name in self._pipelines:
+            logger.info(f"Custom pipeline '{pipeline.name}' overrides built-in")
+        
+        self._pipelines[pipeline.name] = pipeline
+        self._custom_definitions.append(data)
+        logger.debug(f"Loaded custom pipeline: {pipeline.name} from {source}")
+    
     def get(self, name: str) -> Pipeline | None:
         """
         Get a pipeline by name.
@@ -6,20 +6,43 @@ Routes tasks to appropriate agents based on LLM classification.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
+import time
+from collections import OrderedDict
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
-import aiohttp
 from pydantic import BaseModel
 
 if TYPE_CHECKING:
+    import aiohttp
+    
     from ..agents.base import BaseAgent
     from .session import Session
 
 
 logger = logging.getLogger(__name__)
 
+# Runs of anything but letters and digits, treated as one separator in cache keys
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def normalize_request(user_input: str) -> str:
+    """
+    Normalize a request for classification cache keys.
+    
+    Case, punctuation and spacing don't change how a request is classified,
+    so "Add player movement!" and "add  player movement" share a key.
+    """
+    return _NON_WORD_RE.sub(" ", user_input.lower()).strip()
+
+
+# Bounds for the in-memory cache of LLM classifications (see AgentRouter)
+CLASSIFIER_CACHE_SIZE = 512
+CLASSIFIER_CACHE_TTL = 10 * 60  # seconds
+
 
 class TaskType(str, Enum):
     """Types of tasks that can be routed to agents."""
@@ -65,6 +88,10 @@ class ProjectType(str, Enum):
     PROJECT_3D = "3d"
 
 
+# Classification cache key: normalized request, project type, project phase
+CacheKey = tuple[str, ProjectType, str]
+
+
 class RoutingDecision(BaseModel):
     """Result of routing a task."""
     
@@ -75,6 +102,32 @@ class RoutingDecision(BaseModel):
     requires_human_approval: bool = False
 
 
+# Keywords that name a dimension explicitly, overriding the project type
+EXPLICIT_3D_KEYWORDS = ("3d", "mesh", "camera3d", "characterbody3d")
+EXPLICIT_2D_KEYWORDS = ("2d", "sprite", "camera2d", "characterbody2d", "tilemap")
+
+# Development actions for explicit 2D/3D requests: (keywords, 2D task, 3D task)
+EXPLICIT_DEV_ACTIONS = (
+    (
+        ("implement", "code", "feature"),
+        TaskType.IMPLEMENT_FEATURE_2D,
+        TaskType.IMPLEMENT_FEATURE_3D,
+    ),
+    (("scene", "node"), TaskType.CREATE_SCENE_2D, TaskType.CREATE_SCENE_3D),
+    (("script", "gdscript"), TaskType.WRITE_SCRIPT_2D, TaskType.WRITE_SCRIPT_3D),
+    (("bug", "fix", "debug"), TaskType.DEBUG_2D, TaskType.DEBUG_3D),
+)
+
+# Keywords hinting at a non-development task; these requests always go to the LLM
+NON_DEV_KEYWORDS = (
+    "concept", "idea", "game about", "architecture", "design", "structure",
+    "mechanic", "gameplay", "ability", "control", "level", "environment",
+    "world", "balance", "difficulty", "tuning", "visual", "style",
+    "art direction", "asset", "model", "texture", "prompt", "test", "verify", "review",
+    "check", "validate",
+)
+
+
 # Classification prompt for the router LLM
 CLASSIFICATION_SYSTEM_PROMPT = """You are a task classifier for a Godot game development system. Your job is to analyze user requests and classify them into the correct task type.
 
@@ -127,6 +180,11 @@ IMPORTANT RULES:
 
 Respond with ONLY the task type (e.g., "game_concept" or "implement_feature_2d"). No explanation."""
 
+# Rough token count of the classification prompt (~3 characters per token, rounded
+# up), kept when Ollama shifts the context so the prompt's KV cache stays reusable.
+# The prompt holds no per-call values; request context goes in the user message.
+CLASSIFIER_NUM_KEEP = -(-len(CLASSIFICATION_SYSTEM_PROMPT) // 3)
+
 
 class AgentRouter:
     """Routes tasks to the appropriate agent using LLM-based classification."""
@@ -177,6 +235,14 @@ class AgentRouter:
         """
         Initialize the router.
         
+        Classifier requests share one HTTP session (see close()). Ollama only
+        serves concurrent requests, e.g. from classify_requests(), in parallel
+        when started with OLLAMA_NUM_PARALLEL above 1; otherwise it queues them.
+        
+        Successful LLM classifications are remembered in memory, keyed on the
+        normalized request plus the full context sent with it (project,
+        phase and recent conversation), so exact repeats skip the classifier.
+        
         Args:
             ollama_base_url: Base URL for Ollama API
             classifier_model: Model to use for classification (default: qwen2.5-coder:14b)
@@ -184,6 +250,22 @@ class AgentRouter:
         self.ollama_base_url = ollama_base_url
         self.classifier_model = classifier_model
         self.agents: dict[str, BaseAgent] = {}
+        # (request, project type, phase) -> (task type, monotonic time classified),
+        # least recently used first
+        self._cache: OrderedDict[CacheKey, tuple[TaskType, float]] = OrderedDict()
+        self._http: aiohttp.ClientSession | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
+        # Fixed part of every classifier request; only the user message varies
+        self._base_payload: dict[str, Any] = {
+            "model": self.classifier_model,
+            "stream": False,
+            "options": {
+                "temperature": 0.1,  # Low temperature for consistent classification
+                "num_predict": 50,   # Short response expected
+                "num_keep": CLASSIFIER_NUM_KEEP,
+            },
+        }
+        self._system_message = {"role": "system", "content": CLASSIFICATION_SYSTEM_PROMPT}
     
     def register_agent(self, name: str, agent: BaseAgent) -> None:
         """Register an agent with the router."""
@@ -255,8 +337,113 @@ class AgentRouter:
         Returns:
             The classified TaskType
         """
-        # Build context for classifier
+        ruled = self._fast_rule(user_input)
+        if ruled is not None:
+            logger.info(f"Rule classified request as: {ruled.value}")
+            return ruled
+        
+        # Project type is derived once and shared by every step below
         project_type = self.get_project_type(session)
+        cache_key = self._cache_key(user_input, session, project_type)
+        cached = self._cached_classification(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached classification: {cached.value}")
+            return cached
+        
+        context = self._build_classifier_context(session, project_type)
+        user_message = self._build_classifier_message(user_input, context)
+        
+        try:
+            # Call Ollama for classification
+            task_type_str = await self._call_classifier(user_message)
+            task_type_str = task_type_str.strip().lower()
+            
+            # Validate and parse response
+            try:
+                task_type = TaskType(task_type_str)
+                logger.info(f"LLM classified request as: {task_type.value}")
+                self._cache_classification(cache_key, task_type)
+                return task_type
+            except ValueError:
+                logger.warning(
+                    f"LLM returned invalid task type: '{task_type_str}'. "
+                    f"Falling back to keyword classification."
+                )
+                return self._keyword_fallback(user_input, session, project_type)
+                
+        except Exception as e:
+            logger.error(f"LLM classification failed: {e}. Falling back to keywords.")
+            return self._keyword_fallback(user_input, session, project_type)
+    
+    async def classify_requests(self, user_inputs: list[str], session: Session) -> list[TaskType]:
+        """
+        Classify several requests concurrently, in input order.
+        
+        Each request is classified as by classify_request(), with the
+        classifier calls overlapping on the shared HTTP session.
+        """
+        return list(await asyncio.gather(
+            *(self.classify_request(user_input, session) for user_input in user_inputs)
+        ))
+    
+    def _fast_rule(self, user_input: str) -> TaskType | None:
+        """
+        Classify an unambiguous development request without the LLM.
+        
+        Returns a task type only when the request names exactly one
+        dimension (2D or 3D) and exactly one development action, with no
+        hint of a design, art or QA task; otherwise returns None.
+        """
+        input_lower = user_input.lower()
+        is_3d = any(kw in input_lower for kw in EXPLICIT_3D_KEYWORDS)
+        is_2d = any(kw in input_lower for kw in EXPLICIT_2D_KEYWORDS)
+        if is_3d == is_2d:
+            return None
+        if any(kw in input_lower for kw in NON_DEV_KEYWORDS):
+            return None
+        
+        matches = [
+            task_3d if is_3d else task_2d
+            for keywords, task_2d, task_3d in EXPLICIT_DEV_ACTIONS
+            if any(kw in input_lower for kw in keywords)
+        ]
+        return matches[0] if len(matches) == 1 else None
+    
+    def _cache_key(
+        self,
+        user_input: str,
+        session: Session,
+        project_type: ProjectType,
+    ) -> CacheKey:
+        """
+        Key a request by its normalized text, project type and phase.
+        
+        The conversation history is left out: the orchestrator records each
+        request before classifying it, so a history-based key never repeats.
+        """
+        return (normalize_request(user_input), project_type, session.project.current_phase)
+    
+    def _cached_classification(self, key: CacheKey) -> TaskType | None:
+        """Get a cached task type, or None if missing or expired."""
+        entry = self._cache.get(key)
+        if entry is None or time.monotonic() - entry[1] >= CLASSIFIER_CACHE_TTL:
+            return None
+        self._cache.move_to_end(key)
+        return entry[0]
+    
+    def _cache_classification(self, key: CacheKey, task_type: TaskType) -> None:
+        """Remember an LLM classification, evicting the least recently used."""
+        self._cache[key] = (task_type, time.monotonic())
+        self._cache.move_to_end(key)
+        while len(self._cache) > CLASSIFIER_CACHE_SIZE:
+            self._cache.popitem(last=False)
+    
+    def clear_cache(self) -> None:
+        """Forget all cached classifications."""
+        self._cache.clear()
+    
+    def _build_classifier_context(self, session: Session, project_type: ProjectType) -> str:
+        """Describe the session's project and recent conversation for the classifier."""
         context_parts = [
             f"Project: {session.project.name}",
             f"Project Type: {project_type.value}",
@@ -276,69 +463,75 @@ class AgentRouter:
             )
             context_parts.append(f"Recent conversation:\n{history_summary}")
         
-        context_str = "\n".join(context_parts)
-        
-        # Build the classification prompt
+        return "\n".join(context_parts)
+    
+    def _build_classifier_message(self, user_input: str, context: str) -> str:
+        """Build the classifier prompt for a request in the given context."""
         user_message = f"""Context:
-{context_str}
+{context}
 
 User request to classify:
 {user_input}
 
 Task type:"""
-
-        try:
-            # Call Ollama for classification
-            task_type_str = await self._call_classifier(user_message)
-            task_type_str = task_type_str.strip().lower()
-            
-            # Validate and parse response
-            try:
-                task_type = TaskType(task_type_str)
-                logger.info(f"LLM classified request as: {task_type.value}")
-                return task_type
-            except ValueError:
-                logger.warning(
-                    f"LLM returned invalid task type: '{task_type_str}'. "
-                    f"Falling back to keyword classification."
-                )
-                return self._keyword_fallback(user_input, session)
-                
-        except Exception as e:
-            logger.error(f"LLM classification failed: {e}. Falling back to keywords.")
-            return self._keyword_fallback(user_input, session)
+        return user_message
+    
+    async def _get_http(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it for the running event loop."""
+        import aiohttp
+        
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http.closed or self._http_loop is not loop:
+            # Sessions are bound to the loop they were created on; swap in the
+            # new one before closing the stale one so concurrent callers share it
+            stale = self._http
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+            )
+            self._http_loop = loop
+            if stale is not None and not stale.closed:
+                try:
+                    await stale.close()
+                except Exception as e:
+                    logger.debug(f"Failed to close stale HTTP session: {e}")
+        return self._http
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session (a new one is created on next use)."""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+        self._http_loop = None
     
     async def _call_classifier(self, user_message: str) -> str:
         """Call Ollama for classification."""
-        async with aiohttp.ClientSession() as http_session:
-            async with http_session.post(
-                f"{self.ollama_base_url}/api/chat",
-                json={
-                    "model": self.classifier_model,
-                    "messages": [
-                        {"role": "system", "content": CLASSIFICATION_SYSTEM_PROMPT},
-                        {"role": "user", "content": user_message},
-                    ],
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.1,  # Low temperature for consistent classification
-                        "num_predict": 50,   # Short response expected
-                    },
-                },
-            ) as response:
-                if response.status != 200:
-                    raise RuntimeError(f"Ollama API error: {response.status}")
-                data = await response.json()
-                return data["message"]["content"]
+        http = await self._get_http()
+        async with http.post(
+            f"{self.ollama_base_url}/api/chat",
+            json={
+                **self._base_payload,
+                "messages": [self._system_message, {"role": "user", "content": user_message}],
+            },
+        ) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Ollama API error: {response.status}")
+            data = await response.json()
+            return data["message"]["content"]
     
-    def _keyword_fallback(self, user_input: str, session: Session) -> TaskType:
+    def _keyword_fallback(
+        self,
+        user_input: str,
+        session: Session,
+        project_type: ProjectType | None = None,
+    ) -> TaskType:
         """
         Fallback keyword-based classification.
         
         Used when LLM classification fails or returns invalid results.
         """
         input_lower = user_input.lower()
-        project_type = self.get_project_type(session)
+        if project_type is None:
+            project_type = self.get_project_type(session)
         is_3d = project_type == ProjectType.PROJECT_3D
         
         # Architecture/Concept keywords
@@ -358,31 +551,14 @@ Task type:"""
         # Check explicit 3D/2D keywords BEFORE general development keywords
         # This ensures "CharacterBody3D script" routes to 3D, not 2D
         
-        # Explicit 3D keywords override project type
-        if any(kw in input_lower for kw in ["3d", "mesh", "camera3d", "characterbody3d"]):
-            if any(kw in input_lower for kw in ["implement", "code", "feature"]):
-                return TaskType.IMPLEMENT_FEATURE_3D
-            if any(kw in input_lower for kw in ["scene", "node"]):
-                return TaskType.CREATE_SCENE_3D
-            if any(kw in input_lower for kw in ["script", "gdscript"]):
-                return TaskType.WRITE_SCRIPT_3D
-            if any(kw in input_lower for kw in ["bug", "fix", "debug"]):
-                return TaskType.DEBUG_3D
-            # Default to implement for 3D context
-            return TaskType.IMPLEMENT_FEATURE_3D
-        
-        # Explicit 2D keywords
-        if any(kw in input_lower for kw in ["2d", "sprite", "camera2d", "characterbody2d", "tilemap"]):
-            if any(kw in input_lower for kw in ["implement", "code", "feature"]):
-                return TaskType.IMPLEMENT_FEATURE_2D
-            if any(kw in input_lower for kw in ["scene", "node"]):
-                return TaskType.CREATE_SCENE_2D
-            if any(kw in input_lower for kw in ["script", "gdscript"]):
-                return TaskType.WRITE_SCRIPT_2D
-            if any(kw in input_lower for kw in ["bug", "fix", "debug"]):
-                return TaskType.DEBUG_2D
-            # Default to implement for 2D context
-            return TaskType.IMPLEMENT_FEATURE_2D
+        # Explicit 3D keywords override project type, then explicit 2D keywords
+        for keywords, use_3d in ((EXPLICIT_3D_KEYWORDS, True), (EXPLICIT_2D_KEYWORDS, False)):
+            if any(kw in input_lower for kw in keywords):
+                for action_keywords, task_2d, task_3d in EXPLICIT_DEV_ACTIONS:
+                    if any(kw in input_lower for kw in action_keywords):
+                        return task_3d if use_3d else task_2d
+                # Default to implement for an explicit 2D/3D context
+                return TaskType.IMPLEMENT_FEATURE_3D if use_3d else TaskType.IMPLEMENT_FEATURE_2D
         
         # General development keywords (use project type as default)
         if any(kw in input_lower for kw in ["implement", "code", "create feature", "add feature"]):
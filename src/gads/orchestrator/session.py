@@ -6,18 +6,28 @@ Handles conversation history, project state, and persistence.
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import json
 import logging
+import os
 import uuid
+from collections import OrderedDict, deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
 logger = logging.getLogger(__name__)
 
+# Message roles passed to agents as chat history, mapped to the chat API role
+AGENT_HISTORY_ROLES = {"human": "user", "agent": "assistant"}
+
+# Recent messages kept ready-converted for agents (see Session.get_agent_history)
+AGENT_HISTORY_WINDOW = 10
+
 
 class Message(BaseModel):
     """A single message in the conversation history."""
@@ -27,6 +37,11 @@ class Message(BaseModel):
     content: str
     timestamp: datetime = Field(default_factory=datetime.now)
     metadata: dict[str, Any] = Field(default_factory=dict)
+    
+    @property
+    def has_artifacts(self) -> bool:
+        """Whether this is an agent message carrying extracted artifacts."""
+        return self.role == "agent" and bool(self.metadata.get("artifacts"))
 
 
 class ProjectState(BaseModel):
@@ -74,6 +89,44 @@ class Session(BaseModel):
     # Agent-specific memory/context
     agent_contexts: dict[str, dict[str, Any]] = Field(default_factory=dict)
     
+    # Positions in history of messages with artifacts (kept in sync by
+    # add_message/truncate_history so export needn't scan all history)
+    artifact_message_indices: list[int] = Field(default_factory=list)
+    
+    # Chat-format dicts for the last AGENT_HISTORY_WINDOW messages (None for
+    # roles agents don't see), maintained by add_message
+    _agent_history: deque[dict[str, str] | None] = PrivateAttr(
+        default_factory=lambda: deque(maxlen=AGENT_HISTORY_WINDOW)
+    )
+    
+    @model_validator(mode="after")
+    def _index_artifact_messages(self) -> Session:
+        """
+        Build the artifact index for sessions saved before it existed.
+        
+        A stored index is rebuilt too if it doesn't match the history, e.g.
+        after the session file's history was trimmed or edited by hand.
+        """
+        indices = self.artifact_message_indices
+        if "artifact_message_indices" not in self.model_fields_set or not (
+            all(0 <= i < len(self.history) and self.history[i].has_artifacts for i in indices)
+            and all(a < b for a, b in itertools.pairwise(indices))
+        ):
+            self.artifact_message_indices = [
+                i for i, msg in enumerate(self.history) if msg.has_artifacts
+            ]
+        return self
+    
+    def model_post_init(self, __context: Any) -> None:
+        self._rebuild_agent_history()
+    
+    def _rebuild_agent_history(self) -> None:
+        """Convert the most recent messages for get_agent_history."""
+        self._agent_history.clear()
+        self._agent_history.extend(
+            _to_agent_message(msg) for msg in self.history[-AGENT_HISTORY_WINDOW:]
+        )
+    
     def add_message(
         self,
         role: str,
@@ -89,13 +142,44 @@ class Session(BaseModel):
             metadata=metadata or {},
         )
         self.history.append(message)
+        self._agent_history.append(_to_agent_message(message))
+        if message.has_artifacts:
+            self.artifact_message_indices.append(len(self.history) - 1)
         self.updated_at = datetime.now()
         return message
     
+    def artifact_messages(self) -> list[Message]:
+        """Get agent messages that carry artifacts, oldest first."""
+        return [self.history[i] for i in self.artifact_message_indices]
+    
+    @property
+    def message_count(self) -> int:
+        """Number of messages currently held in history (excludes truncated)."""
+        return len(self.history)
+    
     def get_recent_history(self, n: int = 10) -> list[Message]:
         """Get the n most recent messages."""
+        if n <= 0:
+            # history[-0:] would be the whole history
+            return []
         return self.history[-n:]
     
+    def get_agent_history(self, n: int = AGENT_HISTORY_WINDOW) -> list[dict[str, str]]:
+        """
+        Get chat history for agents from the n most recent messages.
+        
+        Human and agent messages become {"role", "content"} dicts with chat
+        API roles; other messages are left out. Up to AGENT_HISTORY_WINDOW
+        messages are served from dicts built once in add_message.
+        """
+        if n <= 0:
+            return []
+        if n <= AGENT_HISTORY_WINDOW:
+            recent = list(self._agent_history)[-n:]
+        else:
+            recent = [_to_agent_message(msg) for msg in self.history[-n:]]
+        return [entry for entry in recent if entry is not None]
+    
     def get_agent_context(self, agent_name: str) -> dict[str, Any]:
         """Get or create context for a specific agent."""
         if agent_name not in self.agent_contexts:
@@ -117,26 +201,43 @@ class Session(BaseModel):
         
         remove_count = len(self.history) - max_messages
         self.history = self.history[-max_messages:]
+        self.artifact_message_indices = [
+            i - remove_count for i in self.artifact_message_indices if i >= remove_count
+        ]
         self.truncated_message_count += remove_count
+        if max_messages < AGENT_HISTORY_WINDOW:
+            self._rebuild_agent_history()
         
         return remove_count
 
 
+def _to_agent_message(message: Message) -> dict[str, str] | None:
+    """Convert a message to the chat format agents expect (None if not shown to agents)."""
+    role = AGENT_HISTORY_ROLES.get(message.role)
+    if role is None:
+        return None
+    return {"role": role, "content": message.content}
+
+
 class SessionManager:
     """Manages session persistence and retrieval."""
     
-    def __init__(self, session_dir: Path, max_history: int = 100):
+    def __init__(self, session_dir: Path, max_history: int = 100, cache_size: int = 32):
         """
         Initialize the session manager.
         
         Args:
             session_dir: Directory for storing session files
             max_history: Maximum messages to retain in history (default 100)
+            cache_size: Maximum loaded sessions kept in memory (0 disables caching)
         """
         self.session_dir = Path(session_dir)
         self.session_dir.mkdir(parents=True, exist_ok=True)
         self.max_history = max_history
+        self.cache_size = cache_size
         self._current_session: Session | None = None
+        # session_id -> (file mtime_ns, session); least recently used first
+        self._cache: OrderedDict[str, tuple[int, Session]] = OrderedDict()
     
     @property
     def current(self) -> Session | None:
@@ -170,18 +271,75 @@ class SessionManager:
         return session
     
     def load(self, session_id: str) -> Session:
-        """Load a session from disk."""
+        """
+        Load a session from disk.
+        
+        Recently loaded sessions are served from a bounded in-memory LRU
+        cache as long as their file hasn't changed on disk since. Each call
+        returns its own copy, so unsaved edits never leak into later loads.
+        """
         path = self.session_dir / f"{session_id}.json"
-        if not path.exists():
-            raise FileNotFoundError(f"Session not found: {session_id}")
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            self._cache.pop(session_id, None)
+            raise FileNotFoundError(f"Session not found: {session_id}") from None
         
-        with open(path) as f:
-            data = json.load(f)
+        cached = self._cache.get(session_id)
+        if cached is not None and cached[0] == mtime_ns:
+            self._cache.move_to_end(session_id)
+            session = cached[1].model_copy(deep=True)
+        else:
+            # Parsed and validated in one pass by pydantic-core
+            with open(path, "rb") as f:
+                session = Session.model_validate_json(f.read())
+            self._remember(session, mtime_ns)
         
-        session = Session.model_validate(data)
         self._current_session = session
         return session
     
+    def _remember(self, session: Session, mtime_ns: int) -> None:
+        """Add a snapshot of a session to the LRU cache, evicting the oldest beyond cache_size."""
+        if self.cache_size <= 0:
+            return
+        self._cache[session.id] = (mtime_ns, session.model_copy(deep=True))
+        self._cache.move_to_end(session.id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+    
+    def most_recent_id(self) -> str | None:
+        """
+        Get the ID of the most recently saved session.
+        
+        Picks the session file with the newest modification time in a single
+        directory scan, without opening or parsing any of them.
+        """
+        newest: os.DirEntry[str] | None = None
+        newest_mtime = -1
+        with os.scandir(self.session_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                mtime_ns = entry.stat().st_mtime_ns
+                if mtime_ns > newest_mtime:
+                    newest, newest_mtime = entry, mtime_ns
+        
+        if newest is None:
+            return None
+        return newest.name[: -len(".json")]
+    
+    def load_most_recent(self) -> Session | None:
+        """
+        Load the most recently saved session.
+        
+        Only the newest session file is read (see most_recent_id), and it is
+        served from the LRU cache when unchanged on disk.
+        """
+        session_id = self.most_recent_id()
+        if session_id is None:
+            return None
+        return self.load(session_id)
+    
     def save(self, session: Session | None = None) -> None:
         """
         Save a session to disk.
@@ -204,14 +362,20 @@ class SessionManager:
             )
         
         path = self.session_dir / f"{session.id}.json"
-        with open(path, "w") as f:
-            json.dump(session.model_dump(mode="json"), f, indent=2, default=str)
+        # Serialized straight to UTF-8 JSON by pydantic-core
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(session.model_dump_json(indent=2))
+        self._remember(session, os.stat(path).st_mtime_ns)
+    
+    async def save_async(self, session: Session | None = None) -> None:
+        """Save a session from a worker thread, keeping disk I/O off the event loop."""
+        await asyncio.to_thread(self.save, session)
     
     def list_sessions(self) -> list[dict[str, Any]]:
         """List all saved sessions."""
         sessions = []
         for path in self.session_dir.glob("*.json"):
-            with open(path) as f:
+            with open(path, "rb") as f:
                 data = json.load(f)
             sessions.append({
                 "id": data["id"],
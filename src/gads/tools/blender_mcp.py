@@ -16,12 +16,17 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
+import shutil
 import subprocess
+import time
 from pathlib import Path
 from typing import Any
 from dataclasses import dataclass, field
 from enum import Enum
 
+from ..utils import read_json_cache, write_json_cache
+
 
 class BlenderConnectionError(Exception):
     """Raised when unable to connect to Blender."""
@@ -62,6 +67,27 @@ class ObjectInfo:
     visible: bool = True
 
 
+# Primitive type -> bpy operator that creates it
+PRIMITIVE_OPS: dict[str, str] = {
+    "cube": "bpy.ops.mesh.primitive_cube_add",
+    "sphere": "bpy.ops.mesh.primitive_uv_sphere_add",
+    "cylinder": "bpy.ops.mesh.primitive_cylinder_add",
+    "plane": "bpy.ops.mesh.primitive_plane_add",
+    "cone": "bpy.ops.mesh.primitive_cone_add",
+    "torus": "bpy.ops.mesh.primitive_torus_add",
+    "monkey": "bpy.ops.mesh.primitive_monkey_add",
+}
+
+
+def _primitive_op(primitive_type: str) -> str:
+    """Look up the bpy operator for a primitive type."""
+    op = PRIMITIVE_OPS.get(primitive_type.lower())
+    if op is None:
+        raise ValueError(f"Unknown primitive type: {primitive_type}. "
+                         f"Available: {list(PRIMITIVE_OPS)}")
+    return op
+
+
 class BlenderMCPTool:
     """
     Tool for creating placeholder 3D assets via Blender subprocess.
@@ -93,10 +119,19 @@ class BlenderMCPTool:
         """Cleanup (no-op for subprocess mode)."""
         pass
     
+    async def __aenter__(self) -> BlenderMCPTool:
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+    
     def _run_blender_script(self, script: str, blend_file: str | None = None) -> str:
         """
         Run a Python script in Blender via subprocess.
         
+        This blocks until Blender exits; async methods call it through
+        asyncio.to_thread so other coroutines keep running meanwhile.
+        
         Args:
             script: Python script to execute
             blend_file: Optional .blend file to open first
@@ -145,7 +180,7 @@ import sys
 print(f"BLENDER_VERSION:{bpy.app.version_string}")
 """
         try:
-            output = self._run_blender_script(script)
+            output = await asyncio.to_thread(self._run_blender_script, script)
             
             # Parse version from output
             version = "unknown"
@@ -170,34 +205,72 @@ print(f"BLENDER_VERSION:{bpy.app.version_string}")
                 "error": str(e),
             }
     
+    async def cached_health_check(self, cache_file: Path, ttl: float = 3600) -> dict[str, Any]:
+        """
+        Health check that reuses a recent successful result from disk.
+        
+        Results are keyed by the resolved Blender executable and its mtime,
+        so upgrading or switching Blender invalidates the cache.
+        
+        Args:
+            cache_file: JSON file holding cached results
+            ttl: Seconds a cached result stays valid
+            
+        Returns:
+            Same dict as health_check()
+        """
+        executable = shutil.which(self.blender_path)
+        if executable is None:
+            return await self.health_check()
+        
+        key = f"{executable}:{os.stat(executable).st_mtime}"
+        cache = read_json_cache(cache_file)
+        
+        entry = cache.get(key)
+        if entry and time.time() - entry.get("checked_at", 0) < ttl:
+            return entry["result"]
+        
+        result = await self.health_check()
+        if result["available"]:
+            cache[key] = {"checked_at": time.time(), "result": result}
+            write_json_cache(cache_file, cache)
+        return result
+    
     # =========================================================================
     # Scene Operations
     # =========================================================================
     
-    async def get_scene_info(self) -> SceneInfo:
-        """Get information about the current Blender scene."""
-        script = """
+    async def get_scene_info(self, max_objects: int | None = None) -> SceneInfo:
+        """
+        Get information about the current Blender scene.
+        
+        Args:
+            max_objects: Only serialize the first N objects (object_count
+                still reports the full scene size)
+        """
+        limit = "" if max_objects is None else str(max(max_objects, 0))
+        script = f"""
 import bpy
 import json
 
 scene = bpy.context.scene
 objects = []
-for obj in scene.objects:
-    objects.append({
+for obj in scene.objects[:{limit}]:
+    objects.append({{
         "name": obj.name,
         "type": obj.type,
         "location": list(obj.location),
-    })
+    }})
 
-result = {
+result = {{
     "name": scene.name,
     "object_count": len(scene.objects),
     "objects": objects,
     "materials_count": len(bpy.data.materials),
-}
-print(f"SCENE_INFO:{json.dumps(result)}")
+}}
+print(f"SCENE_INFO:{{json.dumps(result)}}")
 """
-        output = self._run_blender_script(script)
+        output = await asyncio.to_thread(self._run_blender_script, script)
         
         # Parse JSON from output
         for line in output.split("\n"):
@@ -232,7 +305,7 @@ if obj:
 else:
     print("OBJECT_INFO:null")
 """
-        output = self._run_blender_script(script)
+        output = await asyncio.to_thread(self._run_blender_script, script)
         
         for line in output.split("\n"):
             if line.startswith("OBJECT_INFO:"):
@@ -276,21 +349,7 @@ else:
         Returns:
             Name of the created object
         """
-        primitives = {
-            "cube": "bpy.ops.mesh.primitive_cube_add",
-            "sphere": "bpy.ops.mesh.primitive_uv_sphere_add",
-            "cylinder": "bpy.ops.mesh.primitive_cylinder_add",
-            "plane": "bpy.ops.mesh.primitive_plane_add",
-            "cone": "bpy.ops.mesh.primitive_cone_add",
-            "torus": "bpy.ops.mesh.primitive_torus_add",
-            "monkey": "bpy.ops.mesh.primitive_monkey_add",
-        }
-        
-        if primitive_type.lower() not in primitives:
-            raise ValueError(f"Unknown primitive type: {primitive_type}. "
-                           f"Available: {list(primitives.keys())}")
-        
-        op = primitives[primitive_type.lower()]
+        op = _primitive_op(primitive_type)
         obj_name = name or primitive_type.capitalize()
         
         save_line = ""
@@ -312,7 +371,7 @@ obj.name = "{obj_name}"
 {save_line}
 print(f"CREATED:{{obj.name}}")
 """
-        output = self._run_blender_script(script)
+        output = await asyncio.to_thread(self._run_blender_script, script)
         
         for line in output.split("\n"):
             if line.startswith("CREATED:"):
@@ -362,7 +421,7 @@ bpy.ops.export_scene.gltf(
 )
 print(f"EXPORTED:{filepath}")
 """
-        self._run_blender_script(script, blend_file)
+        await asyncio.to_thread(self._run_blender_script, script, blend_file)
         return output_path
     
     async def export_fbx(
@@ -388,7 +447,7 @@ bpy.ops.export_scene.fbx(
 )
 print(f"EXPORTED:{filepath}")
 """
-        self._run_blender_script(script, blend_file)
+        await asyncio.to_thread(self._run_blender_script, script, blend_file)
         return output_path
     
     async def export_obj(
@@ -414,7 +473,7 @@ bpy.ops.wm.obj_export(
 )
 print(f"EXPORTED:{filepath}")
 """
-        self._run_blender_script(script, blend_file)
+        await asyncio.to_thread(self._run_blender_script, script, blend_file)
         return output_path
     
     # =========================================================================
@@ -442,6 +501,8 @@ print(f"EXPORTED:{filepath}")
         Returns:
             Path to exported file
         """
+        op = _primitive_op(primitive_type)
+        
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
@@ -450,20 +511,6 @@ print(f"EXPORTED:{filepath}")
         
         filepath = str(output_path).replace("\\", "/")
         
-        primitives = {
-            "cube": "bpy.ops.mesh.primitive_cube_add",
-            "sphere": "bpy.ops.mesh.primitive_uv_sphere_add",
-            "cylinder": "bpy.ops.mesh.primitive_cylinder_add",
-            "plane": "bpy.ops.mesh.primitive_plane_add",
-            "cone": "bpy.ops.mesh.primitive_cone_add",
-            "torus": "bpy.ops.mesh.primitive_torus_add",
-            "monkey": "bpy.ops.mesh.primitive_monkey_add",
-        }
-        
-        if primitive_type.lower() not in primitives:
-            raise ValueError(f"Unknown primitive type: {primitive_type}")
-        
-        op = primitives[primitive_type.lower()]
         obj_name = name or primitive_type.capitalize()
         
         script = f"""
@@ -487,9 +534,65 @@ bpy.ops.export_scene.gltf(
 )
 print(f"EXPORTED:{filepath}")
 """
-        self._run_blender_script(script)
+        await asyncio.to_thread(self._run_blender_script, script)
         return output_path
     
+    async def create_and_export_primitives(
+        self,
+        specs: list[dict[str, Any]],
+    ) -> list[Path]:
+        """
+        Create several primitives and export each to its own GLB.
+        
+        All primitives are built in a single Blender run, so Blender's
+        startup cost is paid once for the whole batch.
+        
+        Args:
+            specs: Dicts with ``primitive_type`` and ``output_path`` keys and
+                   optional ``name`` and ``scale`` (same meaning as in
+                   create_and_export_primitive)
+        
+        Returns:
+            Paths to exported files, in spec order
+        """
+        output_paths: list[Path] = []
+        blocks: list[str] = []
+        for spec in specs:
+            primitive_type = spec["primitive_type"]
+            op = _primitive_op(primitive_type)
+            
+            output_path = Path(spec["output_path"])
+            if not str(output_path).endswith(".glb"):
+                output_path = output_path.with_suffix(".glb")
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_paths.append(output_path)
+            
+            filepath = str(output_path).replace("\\", "/")
+            obj_name = spec.get("name") or primitive_type.capitalize()
+            scale = tuple(spec.get("scale", (1, 1, 1)))
+            
+            blocks.append(f"""
+clear_meshes()
+{op}(location=(0, 0, 0), scale={scale})
+bpy.context.active_object.name = {obj_name!r}
+bpy.ops.export_scene.gltf(filepath={filepath!r}, export_format="GLB", use_selection=False)
+print({f"EXPORTED:{filepath}"!r})
+""")
+        
+        if not blocks:
+            return []
+        
+        script = """
+import bpy
+
+def clear_meshes():
+    for obj in list(bpy.data.objects):
+        if obj.type == 'MESH':
+            bpy.data.objects.remove(obj, do_unlink=True)
+""" + "".join(blocks)
+        await asyncio.to_thread(self._run_blender_script, script)
+        return output_paths
+    
     async def export_to_godot_project(
         self,
         project_path: str | Path,
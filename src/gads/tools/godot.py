@@ -116,7 +116,8 @@ class GodotTool:
         
         return project_path
     
-    def _sanitize_name(self, name: str) -> str:
+    @staticmethod
+    def _sanitize_name(name: str) -> str:
         """Convert project name to valid folder name."""
         # Replace spaces with underscores, remove special chars
         safe = "".join(c if c.isalnum() or c in "_-" else "_" for c in name)
@@ -642,6 +643,7 @@ script = ExtResource("1")
         extends: str = "Node",
         folder: str = "scripts",
         content: str | None = None,
+        ensure_dir: bool = True,
     ) -> Path:
         """
         Create a new GDScript file.
@@ -652,12 +654,15 @@ script = ExtResource("1")
             extends: Base class to extend
             folder: Folder within project to save script
             content: Optional full script content
+            ensure_dir: Create the folder if needed; pass False when the
+                        caller has already created it (e.g. batch writes)
             
         Returns:
             Path to created script file
         """
         script_dir = project_path / folder
-        script_dir.mkdir(parents=True, exist_ok=True)
+        if ensure_dir:
+            script_dir.mkdir(parents=True, exist_ok=True)
         
         script_path = script_dir / f"{script_name}.gd"
         
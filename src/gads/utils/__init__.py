@@ -4,12 +4,34 @@ GADS Utilities Module
 Shared utilities and helper functions.
 """
 
-from .config import Settings, load_settings
-from .logging import setup_logging, get_logger
+from typing import TYPE_CHECKING, Any
+
+from .lazy import lazy_getattr
+from .logging import get_logger, setup_logging
+
+if TYPE_CHECKING:
+    from .cache import read_json_cache, write_json_cache
+    from .config import Settings, load_settings
+
+# Settings pull in pydantic-settings, so they (and the cache helpers) are
+# imported on first access; `get_logger` stays cheap for module-level use.
+_LAZY_IMPORTS = {
+    "Settings": ".config",
+    "load_settings": ".config",
+    "read_json_cache": ".cache",
+    "write_json_cache": ".cache",
+}
+
+
+def __getattr__(name: str) -> Any:
+    return lazy_getattr(globals(), _LAZY_IMPORTS, name)
+
 
 __all__ = [
     "Settings",
     "load_settings",
     "setup_logging",
     "get_logger",
+    "read_json_cache",
+    "write_json_cache",
 ]
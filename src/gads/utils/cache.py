@@ -0,0 +1,33 @@
+"""
+On-Disk Cache Helpers for GADS
+
+Small JSON cache files used to skip slow tool probes between runs.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+def read_json_cache(path: Path) -> dict[str, Any]:
+    """Read a JSON cache file, returning an empty dict if missing or corrupt."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_json_cache(path: Path, data: dict[str, Any]) -> None:
+    """Atomically write a JSON cache file (best effort; errors are ignored)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        # Unwritable location or data that isn't JSON-serializable
+        pass
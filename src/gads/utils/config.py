@@ -49,6 +49,21 @@ class Settings(BaseSettings):
     # Session
     session_dir: Path = Field(default=Path("./sessions"), description="Session storage directory")
     max_session_history: int = Field(default=100, description="Max messages to keep in history")
+    session_cache_size: int = Field(default=32, description="Max loaded sessions cached in memory")
+    
+    # Pipelines
+    max_parallel_agents: int = Field(
+        default=3, description="Max independent pipeline steps run at once"
+    )
+    max_concurrent_llm_calls: int = Field(
+        default=8, description="Max agent LLM calls in flight across all runs"
+    )
+    
+    # Cache
+    cache_dir: Path = Field(
+        default=Path.home() / ".cache" / "gads",
+        description="Directory for cached tool state (e.g. Blender health checks)",
+    )
 
 
 def load_settings(env_file: str | None = None) -> Settings:
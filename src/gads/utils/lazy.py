@@ -0,0 +1,29 @@
+"""
+GADS Lazy Imports
+
+PEP 562 helper for packages that import public names on first access.
+"""
+
+import importlib
+from typing import Any
+
+
+def lazy_getattr(module_globals: dict[str, Any], lazy_imports: dict[str, str], name: str) -> Any:
+    """
+    Resolve a lazily imported name for a package's module-level __getattr__.
+    
+    Args:
+        module_globals: The package's globals(); the value is cached there
+        lazy_imports: Public name -> relative module that defines it
+        name: Attribute being looked up
+    
+    Returns:
+        The imported value
+    """
+    package = module_globals["__name__"]
+    module_name = lazy_imports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, package), name)
+    module_globals[name] = value
+    return value
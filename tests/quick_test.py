@@ -104,8 +104,6 @@ async def test_router_classification():
         approval_callback=lambda msg, decision: True,
     )
     
-    session = orchestrator.new_project("Router Test", "Testing classification")
-    
     test_cases = [
         ("I want to make a game about robots", "architect tasks"),
         ("Write a player movement script", "developer tasks"),
@@ -114,14 +112,17 @@ async def test_router_classification():
     
     all_passed = True
     
-    for prompt, expected_category in test_cases:
-        try:
-            task_type = await orchestrator.router.classify_request(prompt, session)
-            print(f"\n✓ '{prompt[:40]}...'")
-            print(f"  → Classified as: {task_type.value}")
-        except Exception as e:
-            print(f"\n✗ '{prompt[:40]}...' failed: {e}")
-            all_passed = False
+    async with orchestrator:
+        session = orchestrator.new_project("Router Test", "Testing classification")
+        
+        for prompt, expected_category in test_cases:
+            try:
+                task_type = await orchestrator.router.classify_request(prompt, session)
+                print(f"\n✓ '{prompt[:40]}...'")
+                print(f"  → Classified as: {task_type.value}")
+            except Exception as e:
+                print(f"\n✗ '{prompt[:40]}...' failed: {e}")
+                all_passed = False
     
     return all_passed
 
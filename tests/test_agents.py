@@ -3,7 +3,7 @@ Tests for GADS Agents
 """
 
 import pytest
-from gads.agents.base import AgentConfig, AgentResponse, ModelProvider
+from gads.agents.base import AgentConfig, AgentResponse, ModelProvider, TokenUsage
 
 
 class TestAgentConfig:
@@ -63,3 +63,25 @@ class TestAgentResponse:
         )
         
         assert "gdscript_blocks" in response.artifacts
+
+
+class TestTokenUsage:
+    """Tests for TokenUsage cost estimates."""
+    
+    def test_rates_for_known_and_unknown_models(self):
+        """Test per-token rates, with unknown Claude models priced like Opus."""
+        haiku = TokenUsage.rates_for("claude-haiku-4-5-20251001")
+        assert haiku == (0.8 / 1_000_000, 4.0 / 1_000_000)
+        opus = TokenUsage.rates_for("claude-3-opus-20240229")
+        assert TokenUsage.rates_for("claude-opus-4-5-20251101") == opus
+    
+    def test_local_models_are_free(self):
+        """Test that Ollama models aren't charged."""
+        assert TokenUsage.rates_for("qwen2.5-coder:14b") == (0.0, 0.0)
+        assert TokenUsage(input_tokens=1000, output_tokens=500).estimate_cost("llama3.1:8b") == 0.0
+    
+    def test_estimate_cost(self):
+        """Test cost estimate from token counts."""
+        usage = TokenUsage(input_tokens=1_000_000, output_tokens=500_000)
+        
+        assert usage.estimate_cost("claude-sonnet-4-5-20250929") == pytest.approx(3.0 + 7.5)
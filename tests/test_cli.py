@@ -0,0 +1,90 @@
+"""
+Tests for the GADS command line interface
+"""
+
+import json
+
+from typer.testing import CliRunner
+
+from gads.cli import _extract_script_headers, app
+
+runner = CliRunner()
+
+
+class TestBlenderBatch:
+    """Tests for the blender batch command."""
+    
+    def test_bad_spec_values_rejected(self, tmp_path):
+        """Test that wrongly typed spec values are reported as an invalid spec."""
+        for entry in (
+            {"primitive": 3, "output": "cube.glb"},
+            {"primitive": "cube", "output": "cube.glb", "scale": "big"},
+            {"primitive": "cube", "output": "cube.glb", "scale": True},
+        ):
+            spec = tmp_path / "spec.json"
+            spec.write_text(json.dumps([entry]), encoding="utf-8")
+            
+            result = runner.invoke(app, ["blender", "batch", "--spec", str(spec)])
+            
+            assert result.exit_code == 1
+            assert "Invalid spec file" in result.output
+
+
+class TestShell:
+    """Tests for the interactive shell."""
+    
+    def test_dispatches_commands(self):
+        """Test that shell lines run as gads commands until 'exit'."""
+        result = runner.invoke(app, ["shell"], input="pipeline list\nexit\n")
+        
+        assert result.exit_code == 0
+        assert "Available Pipelines" in result.output
+    
+    def test_unknown_command_keeps_shell_open(self):
+        """Test that usage errors are reported and the next line still runs."""
+        result = runner.invoke(
+            app, ["shell"], input="frobnicate\npipeline list --bogus\npipeline list\nexit\n"
+        )
+        
+        assert result.exit_code == 0
+        assert "No such command 'frobnicate'" in result.output
+        assert "No such option: --bogus" in result.output
+        assert "Available Pipelines" in result.output
+
+
+class TestExtractScriptHeaders:
+    """Tests for naming exported GDScript blocks."""
+    
+    def test_headers_mapped_to_their_blocks(self):
+        """Test that each block gets its own class_name, base or fallback name."""
+        blocks = [
+            (0, "class_name Enemy\nextends CharacterBody2D\n"),
+            (1, "extends CharacterBody3D\n\nfunc _ready():\n\tpass\n"),
+            (2, "# extends Area2D in a comment\nextends Area2D\n"),
+            (3, "func helper():\n\tpass\n"),
+            (4, "extends Node2D\n"),
+        ]
+        
+        assert _extract_script_headers(blocks) == [
+            ("enemy", "CharacterBody2D"),
+            ("player", "CharacterBody3D"),
+            ("trigger", "Area2D"),
+            ("script_3", "Node"),
+            ("script_4", "Node2D"),
+        ]
+    
+    def test_declarations_past_scan_window_ignored(self):
+        """Test that only the start of a block is scanned, and matches don't spill over."""
+        blocks = [
+            (0, "x" * 600 + "\nclass_name Late\n"),
+            (1, "class_name Early\n"),
+        ]
+        
+        assert _extract_script_headers(blocks) == [
+            ("script_0", "Node"),
+            ("early", "Node"),
+        ]
+    
+    def test_no_blocks(self):
+        """Test that an empty block list gives no headers."""
+        assert _extract_script_headers([]) == []
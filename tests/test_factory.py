@@ -117,6 +117,19 @@ class TestAgentFactory:
         assert "developer_2d" in available
         assert "developer_3d" in available
     
+    def test_available_agents_refreshed_on_reload(self, config_file, tmp_path):
+        """Test the memoized agent list follows a config reload."""
+        factory = AgentFactory(config_path=config_file)
+        factory.load_config()
+        factory.available_agents.append("not_an_agent")
+        assert "not_an_agent" not in factory.available_agents
+        
+        other = tmp_path / "other.yaml"
+        other.write_text('qa:\n  provider: "ollama"\n  model: "llama3.2:3b"\n')
+        factory.load_config(other)
+        
+        assert factory.available_agents == ["qa"]
+    
     def test_get_agent(self, config_file):
         """Test retrieving a created agent."""
         factory = AgentFactory(config_path=config_file)
@@ -11,6 +11,7 @@ from gads.orchestrator import (
     Session,
     TaskType,
     Pipeline,
+    PipelineRegistry,
     PipelineStatus,
 )
 from gads.agents import AgentResponse
@@ -76,6 +77,7 @@ def settings(tmp_path):
     
     return Settings(
         session_dir=tmp_path / "sessions",
+        cache_dir=tmp_path / "cache",
         anthropic_api_key="",
         ollama_host="http://localhost:11434",
     )
@@ -100,6 +102,17 @@ class TestOrchestratorInit:
         
         assert len(orchestrator.router.agents) == 5
         assert orchestrator.router.agents["architect"] is orchestrator.agents["architect"]
+    
+    @pytest.mark.asyncio
+    async def test_async_context_closes_router(self, config_dir, settings):
+        """Test that leaving an async with block releases the router's HTTP session."""
+        orchestrator = Orchestrator(settings=settings, config_dir=config_dir)
+        
+        with patch.object(orchestrator.router, "close", AsyncMock()) as mock_close:
+            async with orchestrator as entered:
+                assert entered is orchestrator
+        
+        mock_close.assert_awaited_once()
 
 
 class TestOrchestratorSession:
@@ -142,6 +155,22 @@ class TestOrchestratorSession:
         assert retrieved is not None
         assert retrieved.id == session_id
         assert retrieved.project.name == "Test Game"
+    
+    def test_get_most_recent_session(self, config_dir, settings):
+        """Test loading the most recently updated session."""
+        orchestrator = Orchestrator(settings=settings, config_dir=config_dir)
+        
+        assert orchestrator.get_most_recent_session() is None
+        
+        orchestrator.new_project("Game 1")
+        latest = orchestrator.new_project("Game 2")
+        
+        fresh = Orchestrator(settings=settings, config_dir=config_dir)
+        recent = fresh.get_most_recent_session()
+        
+        assert recent is not None
+        assert recent.id == latest.id
+        assert fresh.session_manager.current is recent
 
 
 class TestOrchestratorRun:
@@ -229,6 +258,45 @@ class TestOrchestratorRun:
         assert response.agent_name == "system"
         assert "cancelled" in response.content.lower()
     
+    @pytest.mark.asyncio
+    async def test_run_async_approval_rejected(self, config_dir, settings):
+        """Test run() awaits an async approval callback."""
+        async def reject_all(msg, decision):
+            return False
+        
+        orchestrator = Orchestrator(
+            settings=settings,
+            config_dir=config_dir,
+            approval_callback=reject_all,
+        )
+        session = orchestrator.new_project("Test Game")
+        
+        response = await orchestrator.run(
+            "Create a game concept",
+            session=session,
+            task_type=TaskType.GAME_CONCEPT,
+        )
+        
+        assert response.agent_name == "system"
+        assert "cancelled" in response.content.lower()
+    
+    @pytest.mark.asyncio
+    async def test_set_approval_callback(self, config_dir, settings):
+        """Test swapping the approval callback on an existing orchestrator."""
+        orchestrator = Orchestrator(settings=settings, config_dir=config_dir)
+        orchestrator.set_approval_callback(lambda msg, decision: False)
+        session = orchestrator.new_project("Test Game")
+        
+        response = await orchestrator.run(
+            "Create a game concept",
+            session=session,
+            task_type=TaskType.GAME_CONCEPT,
+        )
+        assert response.agent_name == "system"
+        
+        orchestrator.set_approval_callback(None)
+        assert orchestrator.approval_callback == orchestrator._default_approval
+    
     @pytest.mark.asyncio
     async def test_run_with_llm_classification(self, config_dir, settings):
         """Test run() uses LLM classification when task_type not provided."""
@@ -262,6 +330,53 @@ class TestOrchestratorRun:
         
         assert response.agent_name == "architect"
         mock_classify.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_run_reuses_cached_classification(self, config_dir, settings):
+        """Test that repeating a request through run() calls the classifier once."""
+        orchestrator = Orchestrator(settings=settings, config_dir=config_dir)
+        session = orchestrator.new_project("Test Game")
+        
+        mock_response = AgentResponse(
+            content="Architect response",
+            agent_name="architect",
+            model="llama3.1:8b",
+        )
+        mock_call = AsyncMock(return_value="game_concept")
+        mock_execute = AsyncMock(return_value=mock_response)
+        
+        with patch.object(
+            orchestrator.router,
+            "_call_classifier",
+            mock_call,
+        ), patch.object(
+            orchestrator.agents["architect"],
+            "execute",
+            mock_execute,
+        ):
+            await orchestrator.run("Make a space game", session=session)
+            response = await orchestrator.run("make a space game!", session=session)
+        
+        assert response.agent_name == "architect"
+        mock_call.assert_called_once()
+        assert mock_execute.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_classifier_cache_cleared(self, config_dir, settings):
+        """Test that clearing the cache sends a repeated request to the LLM again."""
+        orchestrator = Orchestrator(settings=settings, config_dir=config_dir)
+        session = orchestrator.new_project("Test Game")
+        mock_call = AsyncMock(return_value="game_concept")
+        
+        with patch.object(orchestrator.router, "_call_classifier", mock_call):
+            await orchestrator.router.classify_request("Make a space game", session)
+            await orchestrator.router.classify_request("  make a space game ", session)
+            mock_call.assert_called_once()
+            
+            orchestrator.clear_classifier_cache()
+            await orchestrator.router.classify_request("Make a space game", session)
+        
+        assert mock_call.call_count == 2
 
 
 class TestOrchestratorPipeline:
@@ -392,3 +507,214 @@ class TestOrchestratorPipeline:
         assert result.status == PipelineStatus.COMPLETED
         # Developer should receive the designer's output as input
         assert captured_inputs[1][1] == "Jump mechanic design: player presses space to jump"
+    
+    @pytest.mark.asyncio
+    async def test_run_pipeline_runs_independent_steps_concurrently(self, config_dir, settings):
+        """Test that steps sharing only a dependency run at the same time."""
+        import asyncio
+        
+        orchestrator = Orchestrator(settings=settings, config_dir=config_dir)
+        session = orchestrator.new_project("Test Game")
+        
+        pipeline = (
+            Pipeline("test", "Test pipeline")
+            .add_step("concept", "game_concept", output_key="concept")
+            .add_step("mechanics", "mechanic_design", input_key="concept",
+                      output_key="mechanics", depends_on=["concept"])
+            .add_step("review", "review", input_key="concept",
+                      output_key="review", depends_on=["concept"])
+        )
+        
+        in_flight = 0
+        peak = 0
+        
+        def agent_stub(name):
+            async def execute(user_input, context, history):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return AgentResponse(content=f"{name} output", agent_name=name, model="llama3.1:8b")
+            return execute
+        
+        with patch.object(
+            orchestrator.agents["architect"], "execute", side_effect=agent_stub("architect"),
+        ), patch.object(
+            orchestrator.agents["designer"], "execute", side_effect=agent_stub("designer"),
+        ), patch.object(
+            orchestrator.agents["qa"], "execute", side_effect=agent_stub("qa"),
+        ):
+            result = await orchestrator.run_pipeline(
+                pipeline, session=session, initial_input="Test"
+            )
+        
+        assert result.status == PipelineStatus.COMPLETED
+        assert result.completed_steps[0] == "concept"
+        assert set(result.completed_steps[1:]) == {"mechanics", "review"}
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_llm_calls_limited_across_pipelines(self, config_dir, settings):
+        """Test that concurrent pipelines share the LLM call limit."""
+        import asyncio
+        
+        settings.max_concurrent_llm_calls = 1
+        orchestrator = Orchestrator(settings=settings, config_dir=config_dir)
+        pipeline = Pipeline("test").add_step("design", "mechanic_design", output_key="design")
+        
+        in_flight = 0
+        peak = 0
+        
+        async def execute(user_input, context, history):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return AgentResponse(content="design", agent_name="designer", model="llama3.1:8b")
+        
+        with patch.object(orchestrator.agents["designer"], "execute", side_effect=execute):
+            results = await asyncio.gather(*(
+                orchestrator.run_pipeline(
+                    pipeline, session=orchestrator.new_project(f"Game {i}"), initial_input="Test",
+                )
+                for i in range(3)
+            ))
+        
+        assert all(r.status == PipelineStatus.COMPLETED for r in results)
+        assert peak == 1
+
+
+class TestPipelineWaves:
+    """Tests for pipeline dependency scheduling."""
+    
+    def test_steps_default_to_sequential(self):
+        """Test that steps without depends_on follow the previous step."""
+        pipeline = (
+            Pipeline("test")
+            .add_step("a", "game_concept")
+            .add_step("b", "architecture")
+            .add_step("c", "review")
+        )
+        
+        assert [[s.name for s in wave] for wave in pipeline.waves()] == [["a"], ["b"], ["c"]]
+    
+    def test_depends_on_inferred_from_input_key(self):
+        """Test that steps reading the same output run in the same wave."""
+        pipeline = (
+            Pipeline("test")
+            .add_step("concept", "game_concept", output_key="concept")
+            .add_step(
+                "architecture", "architecture", input_key="concept", output_key="architecture"
+            )
+            .add_step("visual_style", "visual_style", input_key="concept", output_key="art_style")
+            .add_step("review", "review")
+        )
+        
+        assert [[s.name for s in wave] for wave in pipeline.waves()] == [
+            ["concept"], ["architecture", "visual_style"], ["review"]
+        ]
+    
+    def test_independent_steps_share_a_wave(self):
+        """Test that steps with the same dependency are grouped together."""
+        pipeline = (
+            Pipeline("test")
+            .add_step("a", "game_concept")
+            .add_step("b", "architecture", depends_on=["a"])
+            .add_step("c", "visual_style", depends_on=["a"])
+            .add_step("d", "review", depends_on=["b", "c"])
+        )
+        
+        assert [[s.name for s in wave] for wave in pipeline.waves()] == [["a"], ["b", "c"], ["d"]]
+    
+    def test_invalid_dependencies_rejected(self):
+        """Test that unknown dependencies and cycles raise ValueError."""
+        unknown = Pipeline("test").add_step("a", "game_concept", depends_on=["missing"])
+        with pytest.raises(ValueError, match="unknown"):
+            unknown.waves()
+        
+        cycle = (
+            Pipeline("test")
+            .add_step("a", "game_concept", depends_on=["b"])
+            .add_step("b", "architecture", depends_on=["a"])
+        )
+        with pytest.raises(ValueError, match="cycle"):
+            cycle.waves()
+
+
+class TestPipelineRegistryCache:
+    """Tests for the on-disk pipeline registry cache."""
+    
+    @pytest.fixture
+    def templates_dir(self, tmp_path):
+        """Create a templates directory with one custom pipeline."""
+        pipelines_dir = tmp_path / "templates" / "pipelines"
+        pipelines_dir.mkdir(parents=True)
+        (pipelines_dir / "custom.yaml").write_text(
+            "name: custom\ndescription: First\nsteps:\n"
+            "  - name: design\n    task_type: mechanic_design\n"
+        )
+        return tmp_path / "templates"
+    
+    def test_cached_definitions_reused(self, templates_dir, tmp_path):
+        """Test that an unchanged templates dir loads from the cache file."""
+        cache_file = tmp_path / "cache" / "pipeline_registry.json"
+        
+        first = PipelineRegistry.load_cached(templates_dir, cache_file=cache_file)
+        assert first.get("custom").description == "First"
+        assert cache_file.exists()
+        
+        with patch("gads.orchestrator.registry.yaml.load") as yaml_load:
+            second = PipelineRegistry.load_cached(templates_dir, cache_file=cache_file)
+        
+        yaml_load.assert_not_called()
+        assert second.get("custom").description == "First"
+        assert "new-game" in second
+    
+    def test_cache_invalidated_on_edit(self, templates_dir, tmp_path):
+        """Test that editing a pipeline file bypasses the stale cache."""
+        import os
+        
+        cache_file = tmp_path / "cache" / "pipeline_registry.json"
+        PipelineRegistry.load_cached(templates_dir, cache_file=cache_file)
+        
+        yaml_file = templates_dir / "pipelines" / "custom.yaml"
+        yaml_file.write_text(yaml_file.read_text().replace("First", "Second"))
+        stat = yaml_file.stat()
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        registry = PipelineRegistry.load_cached(templates_dir, cache_file=cache_file)
+        assert registry.get("custom").description == "Second"
+    
+    def test_unchanged_files_not_reparsed(self, templates_dir):
+        """Test that new registries reuse definitions parsed earlier in the process."""
+        first = PipelineRegistry(templates_dir)
+        
+        with patch("gads.orchestrator.registry.yaml.load") as yaml_load:
+            second = PipelineRegistry(templates_dir)
+        
+        yaml_load.assert_not_called()
+        assert second.get("custom").steps[0].name == first.get("custom").steps[0].name
+    
+    def test_registries_do_not_share_pipelines(self, templates_dir):
+        """Test that editing one registry's pipelines leaves later registries alone."""
+        first = PipelineRegistry(templates_dir)
+        first.get("custom").add_step("extra", "review")
+        first.get("feature").add_step("extra", "review")
+        
+        second = PipelineRegistry(templates_dir)
+        
+        assert second.get("custom").steps[-1].name != "extra"
+        assert second.get("feature").steps[-1].name != "extra"
+    
+    def test_unknown_task_type_rejected_on_load(self, templates_dir):
+        """Test that a pipeline with an unknown task type isn't registered."""
+        (templates_dir / "pipelines" / "broken.yaml").write_text(
+            "name: broken\nsteps:\n  - name: design\n    task_type: not_a_task\n"
+        )
+        
+        registry = PipelineRegistry(templates_dir)
+        
+        assert "broken" not in registry
+        assert registry.get("custom").steps[0].task == TaskType.MECHANIC_DESIGN
@@ -11,6 +11,7 @@ from gads.orchestrator.router import (
     ProjectType,
     RoutingDecision,
     CLASSIFICATION_SYSTEM_PROMPT,
+    normalize_request,
 )
 from gads.orchestrator.session import Session, ProjectState
 
@@ -98,6 +99,44 @@ class TestKeywordFallback:
         assert result == TaskType.DEBUG_2D
 
 
+class TestNormalizeRequest:
+    """Tests for classification cache key normalization."""
+    
+    def test_case_punctuation_and_spacing_ignored(self):
+        """Test that cosmetic differences normalize to the same text."""
+        assert normalize_request("Add player movement!") == "add player movement"
+        assert normalize_request("  add\tplayer -- movement ") == "add player movement"
+    
+    def test_words_preserved(self):
+        """Test that different wording stays distinct."""
+        assert normalize_request("add 3D movement") != normalize_request("add 2D movement")
+
+
+class TestFastRule:
+    """Tests for rule-based classification ahead of the LLM."""
+    
+    def test_unambiguous_requests(self, router):
+        """Test that one dimension plus one action is classified directly."""
+        assert router._fast_rule("Debug this CharacterBody3D") == TaskType.DEBUG_3D
+        assert router._fast_rule("Write a 2D enemy script") == TaskType.WRITE_SCRIPT_2D
+    
+    def test_ambiguous_requests(self, router):
+        """Test that ambiguous or non-development requests are left to the LLM."""
+        assert router._fast_rule("Write a script to debug the player") is None
+        assert router._fast_rule("Port the 2D script to 3D") is None
+        assert router._fast_rule("Design a 3D level and script the doors") is None
+        assert router._fast_rule("Add a wall jump") is None
+    
+    @pytest.mark.asyncio
+    async def test_skips_llm(self, router, session):
+        """Test that a rule match never calls the classifier."""
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            result = await router.classify_request("Fix the Camera2D jitter bug", session)
+        
+        assert result == TaskType.DEBUG_2D
+        mock_session_class.assert_not_called()
+
+
 class TestLLMClassification:
     """Tests for LLM-based classification."""
     
@@ -125,6 +164,11 @@ class TestLLMClassification:
             )
         
         assert result == TaskType.MECHANIC_DESIGN
+        
+        payload = mock_session.post.call_args.kwargs["json"]
+        assert payload["messages"][0]["content"] == CLASSIFICATION_SYSTEM_PROMPT
+        assert "Design a wall jump ability" in payload["messages"][1]["content"]
+        assert payload["options"]["num_keep"] > 0
     
     @pytest.mark.asyncio
     async def test_invalid_response_falls_back(self, router, session):
@@ -169,7 +213,86 @@ class TestLLMClassification:
         
         # Should fall back to keyword detection → mechanic_design
         assert result == TaskType.MECHANIC_DESIGN
+    
+    @pytest.mark.asyncio
+    async def test_batch_reuses_http_session(self, router, session):
+        """Test that batched classifications share one HTTP session."""
+        def reply(url, json):
+            request = json["messages"][1]["content"]
+            content = "review" if "Review" in request else "mechanic_design"
+            response = MagicMock()
+            response.status = 200
+            response.json = AsyncMock(return_value={"message": {"content": content}})
+            response.__aenter__ = AsyncMock(return_value=response)
+            response.__aexit__ = AsyncMock(return_value=None)
+            return response
+        
+        with patch("aiohttp.ClientSession") as mock_session_class:
+            mock_session = MagicMock()
+            mock_session.closed = False
+            mock_session.post = MagicMock(side_effect=reply)
+            mock_session.close = AsyncMock()
+            mock_session_class.return_value = mock_session
+            
+            results = await router.classify_requests(
+                ["Design a wall jump", "Review the player script"],
+                session,
+            )
+            await router.close()
+        
+        assert results == [TaskType.MECHANIC_DESIGN, TaskType.REVIEW]
+        mock_session_class.assert_called_once()
+        mock_session.close.assert_awaited_once()
+    
+    def test_stale_http_session_closed_on_new_loop(self, router, session):
+        """Test that a session left on a finished event loop is closed, not leaked."""
+        import asyncio
+        
+        def make_session(**kwargs):
+            response = MagicMock()
+            response.status = 200
+            response.json = AsyncMock(return_value={"message": {"content": "mechanic_design"}})
+            response.__aenter__ = AsyncMock(return_value=response)
+            response.__aexit__ = AsyncMock(return_value=None)
+            http = MagicMock()
+            http.closed = False
+            http.post = MagicMock(return_value=response)
+            http.close = AsyncMock()
+            return http
+        
+        with patch("aiohttp.ClientSession", side_effect=make_session) as mock_session_class:
+            asyncio.run(router.classify_request("Design a wall jump", session))
+            first = router._http
+            asyncio.run(router.classify_request("Design a double jump", session))
+        
+        assert mock_session_class.call_count == 2
+        first.close.assert_awaited_once()
+        router._http.close.assert_not_awaited()
 
+    
+    @pytest.mark.asyncio
+    async def test_classification_cached_per_context(self, router, session):
+        """Test that repeats hit the cache only for the same project type and phase."""
+        mock_call = AsyncMock(return_value="mechanic_design")
+        
+        with patch.object(router, "_call_classifier", mock_call):
+            task_type = await router.classify_request("Design a wall jump", session)
+            assert task_type == TaskType.MECHANIC_DESIGN
+            await router.classify_request("  design a WALL-JUMP! ", session)
+            mock_call.assert_called_once()
+            
+            # New messages don't change the key
+            session.add_message("user", "Design a wall jump")
+            await router.classify_request("Design a wall jump", session)
+            mock_call.assert_called_once()
+            
+            session.project.current_phase = "development"
+            await router.classify_request("Design a wall jump", session)
+            assert mock_call.call_count == 2
+            
+            session.project.game_design_doc = {"project_type": "3d"}
+            await router.classify_request("Design a wall jump", session)
+            assert mock_call.call_count == 3
 
 class TestRouting:
     """Tests for task routing."""
@@ -0,0 +1,218 @@
+"""
+Tests for GADS Session Management
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from gads.orchestrator.session import ProjectState, Session, SessionManager
+
+
+class TestSessionArtifactIndex:
+    """Tests for the index of messages carrying artifacts."""
+    
+    def test_add_message_indexes_artifacts(self):
+        """Test that only agent messages with artifacts are indexed."""
+        session = Session(project=ProjectState(name="Test Game"))
+        session.add_message("human", "Make a player")
+        session.add_message("agent", "Code", agent_name="developer_2d",
+                            metadata={"artifacts": {"gdscript_blocks": ["extends Node"]}})
+        session.add_message("agent", "Chat", agent_name="designer", metadata={"artifacts": {}})
+        
+        assert session.artifact_message_indices == [1]
+        assert [m.content for m in session.artifact_messages()] == ["Code"]
+    
+    def test_truncate_history_shifts_index(self):
+        """Test that truncation drops removed entries and shifts the rest."""
+        session = Session(project=ProjectState(name="Test Game"))
+        for i in range(4):
+            session.add_message(
+                "agent", f"Code {i}", metadata={"artifacts": {"gdscript_blocks": ["x"]}}
+            )
+        
+        session.truncate_history(2)
+        
+        assert session.artifact_message_indices == [0, 1]
+        assert [m.content for m in session.artifact_messages()] == ["Code 2", "Code 3"]
+    
+    def test_index_rebuilt_for_old_session_files(self):
+        """Test that sessions saved without the index get it on load."""
+        session = Session(project=ProjectState(name="Test Game"))
+        session.add_message("human", "Hi")
+        session.add_message("agent", "Code", metadata={"artifacts": {"gdscript_blocks": ["x"]}})
+        data = json.loads(session.model_dump_json())
+        del data["artifact_message_indices"]
+        
+        restored = Session.model_validate(data)
+        assert restored.artifact_message_indices == [1]
+    
+    def test_stale_index_rebuilt_on_load(self):
+        """Test that an index no longer matching an edited history is rebuilt."""
+        session = Session(project=ProjectState(name="Test Game"))
+        session.add_message("human", "Hi")
+        session.add_message("agent", "Code", metadata={"artifacts": {"gdscript_blocks": ["x"]}})
+        data = json.loads(session.model_dump_json())
+        
+        data["history"] = []
+        assert Session.model_validate(data).artifact_messages() == []
+        
+        data["history"] = [session.history[1].model_dump(mode="json")]
+        data["artifact_message_indices"] = [1]
+        restored = Session.model_validate(data)
+        assert restored.artifact_message_indices == [0]
+        assert [m.content for m in restored.artifact_messages()] == ["Code"]
+
+
+class TestSessionAgentHistory:
+    """Tests for chat history handed to agents."""
+    
+    def test_agent_history_maps_roles(self):
+        """Test that human/agent messages are converted and others skipped."""
+        session = Session(project=ProjectState(name="Test Game"))
+        session.add_message("human", "Make a player")
+        session.add_message("system", "Phase changed")
+        session.add_message("agent", "Done", agent_name="developer_2d")
+        
+        assert session.get_agent_history() == [
+            {"role": "user", "content": "Make a player"},
+            {"role": "assistant", "content": "Done"},
+        ]
+        assert session.get_agent_history(1) == [{"role": "assistant", "content": "Done"}]
+    
+    def test_recent_history_bounds(self):
+        """Test that recent history never returns more than n messages."""
+        session = Session(project=ProjectState(name="Test Game"))
+        for i in range(5):
+            session.add_message("human", f"Message {i}")
+        
+        assert session.get_recent_history(0) == []
+        assert session.get_agent_history(0) == []
+        assert [m.content for m in session.get_recent_history(2)] == ["Message 3", "Message 4"]
+    
+    def test_agent_history_survives_reload_and_truncation(self):
+        """Test that loaded and truncated sessions report the same history."""
+        session = Session(project=ProjectState(name="Test Game"))
+        for i in range(15):
+            session.add_message("human", f"Message {i}")
+        
+        reloaded = Session.model_validate(session.model_dump(mode="json"))
+        assert reloaded.get_agent_history() == session.get_agent_history()
+        assert len(reloaded.get_agent_history(12)) == 12
+        
+        session.truncate_history(3)
+        assert [m["content"] for m in session.get_agent_history()] == [
+            "Message 12", "Message 13", "Message 14"
+        ]
+
+
+class TestSessionManagerCache:
+    """Tests for the in-memory session cache."""
+    
+    def test_load_reuses_unchanged_session(self, tmp_path):
+        """Test that loading an unchanged session doesn't re-read its file."""
+        manager = SessionManager(tmp_path)
+        session = manager.create_session("Test Game")
+        
+        with patch.object(Session, "model_validate_json") as validate:
+            loaded = manager.load(session.id)
+        
+        validate.assert_not_called()
+        assert loaded == session
+    
+    def test_unsaved_changes_not_cached(self, tmp_path):
+        """Test that editing a loaded session without saving leaves later loads alone."""
+        manager = SessionManager(tmp_path)
+        session = manager.create_session("Test Game")
+        
+        loaded = manager.load(session.id)
+        loaded.add_message("human", "Unsaved")
+        loaded.project.name = "Renamed"
+        session.add_message("human", "Also unsaved")
+        
+        reloaded = manager.load(session.id)
+        assert reloaded is not loaded
+        assert reloaded.history == []
+        assert reloaded.project.name == "Test Game"
+    
+    def test_load_rereads_modified_file(self, tmp_path):
+        """Test that a session edited on disk is reloaded."""
+        manager = SessionManager(tmp_path)
+        session = manager.create_session("Test Game")
+        
+        path = tmp_path / f"{session.id}.json"
+        data = json.loads(path.read_text())
+        data["project"]["name"] = "Renamed"
+        path.write_text(json.dumps(data))
+        # Make the change visible even on filesystems with coarse timestamps
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        reloaded = manager.load(session.id)
+        assert reloaded is not session
+        assert reloaded.project.name == "Renamed"
+    
+    def test_cache_is_bounded(self, tmp_path):
+        """Test that the least recently used session is evicted."""
+        manager = SessionManager(tmp_path, cache_size=2)
+        first = manager.create_session("Game 1")
+        manager.create_session("Game 2")
+        manager.create_session("Game 3")
+        
+        assert len(manager._cache) == 2
+        assert first.id not in manager._cache
+        assert manager.load(first.id).project.name == "Game 1"
+    
+    @pytest.mark.asyncio
+    async def test_save_async(self, tmp_path):
+        """Test that saving from a worker thread writes and caches the session."""
+        manager = SessionManager(tmp_path)
+        session = manager.create_session("Test Game")
+        session.add_message("human", "Hello")
+        
+        await manager.save_async(session)
+        
+        assert manager.load(session.id) == session
+        data = json.loads((tmp_path / f"{session.id}.json").read_text())
+        assert data["history"][0]["content"] == "Hello"
+    
+    def test_non_ascii_round_trip(self, tmp_path):
+        """Test that non-ASCII text is saved as UTF-8 and loads back unchanged."""
+        manager = SessionManager(tmp_path, cache_size=0)
+        session = manager.create_session("Café Quest 🐉")
+        session.add_message("human", "Añade un diálogo: «¡Hola!» — 你好")
+        manager.save(session)
+        
+        raw = (tmp_path / f"{session.id}.json").read_bytes()
+        assert "Café Quest 🐉".encode() in raw
+        assert json.loads(raw)["history"][0]["content"] == "Añade un diálogo: «¡Hola!» — 你好"
+        
+        reloaded = manager.load(session.id)
+        assert reloaded.project.name == "Café Quest 🐉"
+        assert reloaded.history[0].content == "Añade un diálogo: «¡Hola!» — 你好"
+    
+    def test_load_missing_session(self, tmp_path):
+        """Test that loading an unknown session raises FileNotFoundError."""
+        manager = SessionManager(tmp_path)
+        
+        with pytest.raises(FileNotFoundError):
+            manager.load("does-not-exist")
+    
+    def test_load_most_recent(self, tmp_path):
+        """Test that the most recently saved session is loaded."""
+        manager = SessionManager(tmp_path)
+        assert manager.most_recent_id() is None
+        assert manager.load_most_recent() is None
+        
+        older = manager.create_session("Game 1")
+        newer = manager.create_session("Game 2")
+        stat = os.stat(tmp_path / f"{older.id}.json")
+        os.utime(
+            tmp_path / f"{newer.id}.json",
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000),
+        )
+        
+        assert manager.most_recent_id() == newer.id
+        assert manager.load_most_recent().id == newer.id
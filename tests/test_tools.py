@@ -2,8 +2,10 @@
 Tests for GADS Tools
 """
 
-import pytest
 from pathlib import Path
+
+import pytest
+
 from gads.tools.godot import GodotTool
 
 
@@ -52,3 +54,165 @@ class TestGodotTool:
         
         assert result["valid"] is True
         assert len(result["issues"]) == 0
+
+
+class TestBlenderMCPTool:
+    """Tests for BlenderMCPTool."""
+    
+    async def test_async_context_manager_closes(self, monkeypatch):
+        """Test that leaving the async with block closes the tool."""
+        from gads.tools.blender_mcp import BlenderMCPTool
+        
+        closed = []
+        tool = BlenderMCPTool(blender_path="blender")
+        
+        async def fake_close():
+            closed.append(True)
+        
+        monkeypatch.setattr(tool, "close", fake_close)
+        
+        with pytest.raises(RuntimeError):
+            async with tool as entered:
+                assert entered is tool
+                raise RuntimeError("boom")
+        
+        assert closed == [True]
+    
+    async def test_unknown_primitive_rejected_before_running_blender(self, monkeypatch):
+        """Test that an unknown primitive fails without spawning Blender."""
+        from gads.tools.blender_mcp import BlenderMCPTool
+        
+        tool = BlenderMCPTool(blender_path="blender")
+        
+        def fail_run(*args, **kwargs):
+            raise AssertionError("Blender should not be invoked")
+        
+        monkeypatch.setattr(tool, "_run_blender_script", fail_run)
+        
+        with pytest.raises(ValueError, match="Unknown primitive type"):
+            await tool.create_primitive("pyramid")
+        with pytest.raises(ValueError, match="Unknown primitive type"):
+            await tool.create_and_export_primitive("pyramid", "out.glb")
+    
+    async def test_scene_info_max_objects(self, monkeypatch):
+        """Test that max_objects caps the objects serialized by Blender."""
+        import contextlib
+        import io
+        import sys
+        import types
+
+        from gads.tools.blender_mcp import BlenderMCPTool
+        
+        objects = [
+            types.SimpleNamespace(name=f"Obj{i}", type="MESH", location=(i, 0, 0))
+            for i in range(5)
+        ]
+        fake_bpy = types.SimpleNamespace(
+            context=types.SimpleNamespace(
+                scene=types.SimpleNamespace(name="Scene", objects=objects),
+            ),
+            data=types.SimpleNamespace(materials=[]),
+        )
+        monkeypatch.setitem(sys.modules, "bpy", fake_bpy)
+        
+        def run_script(script, blend_file=None):
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                exec(script, {})
+            return out.getvalue()
+        
+        tool = BlenderMCPTool(blender_path="blender")
+        monkeypatch.setattr(tool, "_run_blender_script", run_script)
+        
+        info = await tool.get_scene_info(max_objects=2)
+        assert info.object_count == 5
+        assert [obj["name"] for obj in info.objects] == ["Obj0", "Obj1"]
+        
+        info = await tool.get_scene_info()
+        assert len(info.objects) == 5
+    
+    async def test_cached_health_check_reuses_result(self, tmp_path, monkeypatch):
+        """Test that a successful health check is served from the cache file."""
+        from gads.tools.blender_mcp import BlenderMCPTool
+        
+        blender = tmp_path / "blender"
+        blender.write_text("#!/bin/sh\n")
+        blender.chmod(0o755)
+        cache_file = tmp_path / "cache" / "blender_health.json"
+        
+        calls = []
+        tool = BlenderMCPTool(blender_path=str(blender))
+        
+        async def fake_health_check():
+            calls.append(True)
+            return {"available": True, "blender_version": "4.2.0", "mode": "subprocess"}
+        
+        monkeypatch.setattr(tool, "health_check", fake_health_check)
+        
+        first = await tool.cached_health_check(cache_file)
+        second = await tool.cached_health_check(cache_file)
+        
+        assert first == second
+        assert second["blender_version"] == "4.2.0"
+        assert len(calls) == 1
+        assert cache_file.exists()
+        
+        await tool.cached_health_check(cache_file, ttl=0)
+        assert len(calls) == 2
+    
+    async def test_batch_export_runs_blender_once(self, tmp_path, monkeypatch):
+        """Test that a batch of primitives is exported in a single Blender run."""
+        import contextlib
+        import io
+        import sys
+        import types
+
+        from gads.tools.blender_mcp import BlenderMCPTool
+        
+        exported = []
+        
+        def add_primitive(location, scale):
+            fake_bpy.context.active_object = types.SimpleNamespace(name=None, scale=scale)
+        
+        def export_gltf(filepath, export_format, use_selection):
+            exported.append((fake_bpy.context.active_object.name, filepath))
+        
+        fake_bpy = types.SimpleNamespace(
+            context=types.SimpleNamespace(active_object=None),
+            data=types.SimpleNamespace(objects=[]),
+            ops=types.SimpleNamespace(
+                mesh=types.SimpleNamespace(
+                    primitive_cube_add=add_primitive,
+                    primitive_uv_sphere_add=add_primitive,
+                ),
+                export_scene=types.SimpleNamespace(gltf=export_gltf),
+            ),
+        )
+        monkeypatch.setitem(sys.modules, "bpy", fake_bpy)
+        
+        runs = []
+        
+        def run_script(script, blend_file=None):
+            runs.append(script)
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                exec(script, {})
+            return out.getvalue()
+        
+        tool = BlenderMCPTool(blender_path="blender")
+        monkeypatch.setattr(tool, "_run_blender_script", run_script)
+        
+        paths = await tool.create_and_export_primitives([
+            {"primitive_type": "cube", "output_path": tmp_path / "crate"},
+            {"primitive_type": "sphere", "output_path": tmp_path / "ball.glb", "name": "Ball"},
+        ])
+        
+        assert len(runs) == 1
+        assert paths == [tmp_path / "crate.glb", tmp_path / "ball.glb"]
+        assert exported == [("Cube", str(paths[0])), ("Ball", str(paths[1]))]
+        
+        with pytest.raises(ValueError, match="Unknown primitive type"):
+            await tool.create_and_export_primitives([
+                {"primitive_type": "pyramid", "output_path": tmp_path / "p.glb"},
+            ])
+        assert len(runs) == 1